@@ -6,12 +6,11 @@ transcription based on speech activity and buffer thresholds.
 """
 
 import threading
-import time
 from typing import Callable, Optional, List
 from dataclasses import dataclass
 from collections import deque
 import numpy as np
-from ..logger import debug
+from ..logger import debug, error
 
 
 @dataclass
@@ -20,7 +19,50 @@ class AudioSegment:
     audio: np.ndarray
     timestamp: float
     is_speech: bool
-    
+
+
+class _SegmentDispatcher:
+    """
+    Persistent worker that runs segment callbacks off the audio thread.
+
+    Bounded with drop-oldest backpressure: a lagging consumer loses the
+    oldest pending segment rather than accumulating queued work.
+    """
+
+    def __init__(self, callback: Callable[[np.ndarray], None], maxlen: int = 2):
+        self._callback = callback
+        self._queue: deque = deque(maxlen=maxlen)
+        self._event = threading.Event()
+        self._worker = threading.Thread(
+            target=self._loop,
+            name="transcribe-worker",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _loop(self) -> None:
+        while True:
+            self._event.wait()
+            self._event.clear()
+            while True:
+                try:
+                    audio = self._queue.popleft()
+                except IndexError:
+                    break
+                try:
+                    self._callback(audio)
+                except Exception as e:
+                    # A failing callback must only lose this segment, never
+                    # the worker itself
+                    error(f"Buffer: Segment callback failed: {e}")
+
+    def submit(self, audio: np.ndarray) -> None:
+        """Queue a segment for the worker, dropping the oldest if full."""
+        if len(self._queue) == self._queue.maxlen:
+            debug("Buffer: Transcriber lagging, dropping oldest pending segment")
+        self._queue.append(audio)
+        self._event.set()
+
 
 class StreamingAudioBuffer:
     """
@@ -42,9 +84,15 @@ class StreamingAudioBuffer:
         ... )
         >>> buffer.add_audio(audio_chunk)  # Called repeatedly
     """
-    
+
     SAMPLE_RATE = 16000
-    
+
+    # Energy gate in front of the VAD: chunks below the calibrated noise
+    # floor (times the margin) skip model inference. The ceiling keeps the
+    # gate from ever swallowing audible audio even if the floor drifts.
+    ENERGY_GATE_MARGIN = 2.0
+    ENERGY_GATE_CEILING = 1e-5  # mean-square amplitude
+
     def __init__(
         self,
         on_segment_ready: Callable[[np.ndarray], None],
@@ -52,6 +100,7 @@ class StreamingAudioBuffer:
         max_segment_duration: float = 10.0,
         speech_pad_ms: int = 200,  # Reduced for lower latency
         use_vad: bool = True,
+        vad_batch_size: int = 2,
     ):
         """
         Initialize the streaming buffer.
@@ -63,22 +112,37 @@ class StreamingAudioBuffer:
             max_segment_duration: Maximum audio duration before forcing trigger (seconds)
             speech_pad_ms: Padding before/after speech segments (milliseconds)
             use_vad: Whether to use VAD for speech detection
+            vad_batch_size: Number of chunks to batch per VAD call. Values > 1
+                           amortize model dispatch at the cost of one chunk of
+                           extra latency per extra batched chunk.
         """
         self.on_segment_ready = on_segment_ready
         self.min_segment_duration = min_segment_duration
         self.max_segment_duration = max_segment_duration
         self.speech_pad_ms = speech_pad_ms
         self.use_vad = use_vad
+        self.vad_batch_size = vad_batch_size
         
-        # Buffer state
-        self._buffer: List[np.ndarray] = []
-        self._buffer_samples = 0
-        self._lock = threading.Lock()
-        
-        # Speech tracking
+        # Buffer state: preallocated ring sized for the longest possible
+        # segment (max duration + trailing pad) plus headroom for the chunk
+        # that crosses the max-duration threshold. A single slice write per
+        # chunk replaces list append + np.concatenate on flush.
+        self._ring = np.empty(
+            int(self.SAMPLE_RATE * (max_segment_duration + speech_pad_ms / 1000)) + 4096,
+            dtype=np.float32,
+        )
+        self._pos = 0
+        # Single-producer discipline: the capture thread is the only writer
+        # of buffer state, so the hot path takes no lock. reset() from other
+        # threads posts a flag that the producer applies before its next
+        # chunk (attribute reads/writes are atomic under the GIL).
+        self._reset_pending = False
+
+        # Speech tracking. Silence is measured in accumulated samples, not
+        # wall-clock time: exact at any chunk size and avoids a time.time()
+        # syscall (~15ms resolution on Windows) per chunk.
         self._speech_started = False
-        self._speech_start_time: Optional[float] = None
-        self._silence_start_time: Optional[float] = None
+        self._silence_samples = 0
         
         # VAD
         self._vad = None
@@ -89,39 +153,97 @@ class StreamingAudioBuffer:
                 min_speech_duration_ms=150,  # Faster trigger
                 min_silence_duration_ms=300,  # Faster end detection
             )
+
+        # Chunks waiting for the next batched VAD call
+        self._vad_pending: List[np.ndarray] = []
+
+        # Noise floor for the energy gate, calibrated from the quietest
+        # chunks seen so far
+        self._energy_floor: Optional[float] = None
         
-        # Pre-buffer for speech padding (reduced for lower latency)
-        self._pre_buffer: deque = deque(
-            maxlen=int(self.SAMPLE_RATE * speech_pad_ms / 1000)
+        # Pre-buffer for speech padding (reduced for lower latency).
+        # Fixed-size circular numpy buffer holding the most recent silence;
+        # written with slice copies instead of per-sample deque appends.
+        self._pre = np.zeros(
+            int(self.SAMPLE_RATE * speech_pad_ms / 1000), dtype=np.float32
         )
-        
+        self._pre_write = 0
+        self._pre_filled = 0
+
+        # Persistent transcription worker: spawning a Thread per segment
+        # costs ~50-200us each and allows unbounded concurrency when the
+        # transcriber lags
+        self._dispatcher = _SegmentDispatcher(on_segment_ready)
+
         debug(f"Buffer: Initialized min={min_segment_duration}s, max={max_segment_duration}s, VAD={use_vad}")
     
     def _get_buffer_duration(self) -> float:
         """Get current buffer duration in seconds."""
-        return self._buffer_samples / self.SAMPLE_RATE
-    
-    def _flush_buffer_unlocked(self) -> Optional[np.ndarray]:
-        """Flush the buffer and return accumulated audio. Caller must hold lock."""
-        if not self._buffer:
+        return self._pos / self.SAMPLE_RATE
+
+    def _append(self, audio: np.ndarray) -> None:
+        """Write a chunk into the ring at the cursor. Producer thread only."""
+        n = len(audio)
+        free = len(self._ring) - self._pos
+        if n > free:
+            # Shouldn't happen (max-duration flush keeps headroom), but never
+            # write past the ring
+            n = free
+            audio = audio[:n]
+        self._ring[self._pos:self._pos + n] = audio
+        self._pos += n
+
+    def _pre_append(self, audio: np.ndarray) -> None:
+        """Write a chunk into the circular pre-buffer. Producer thread only."""
+        size = len(self._pre)
+        if size == 0:
+            return
+        n = len(audio)
+        if n >= size:
+            # Chunk alone fills the ring: keep only its tail
+            np.copyto(self._pre, audio[-size:])
+            self._pre_write = 0
+            self._pre_filled = size
+            return
+        end = self._pre_write + n
+        if end <= size:
+            np.copyto(self._pre[self._pre_write:end], audio)
+            self._pre_write = end % size
+        else:
+            # Wrap: tail-write to the end, head-write from the start
+            split = size - self._pre_write
+            np.copyto(self._pre[self._pre_write:], audio[:split])
+            np.copyto(self._pre[:n - split], audio[split:])
+            self._pre_write = n - split
+        self._pre_filled = min(size, self._pre_filled + n)
+
+    def _pre_snapshot(self) -> Optional[np.ndarray]:
+        """Return pre-buffer contents in chronological order, or None if empty."""
+        if self._pre_filled == 0:
             return None
-        
-        audio = np.concatenate(self._buffer)
-        self._buffer = []
-        self._buffer_samples = 0
-        
+        w = self._pre_write
+        ordered = np.concatenate((self._pre[w:], self._pre[:w]))
+        return ordered[-self._pre_filled:]
+
+    def _flush_buffer(self) -> Optional[np.ndarray]:
+        """Flush the buffer and return accumulated audio. Producer thread only."""
+        if self._pos == 0:
+            return None
+
+        audio = self._ring[:self._pos].copy()
+        self._pos = 0
+
         return audio
     
     def _trigger_transcription(self) -> None:
         """Trigger transcription with current buffer."""
-        with self._lock:
-            audio = self._flush_buffer_unlocked()
+        audio = self._flush_buffer()
         if audio is not None and len(audio) > 0:
             # Add padding from pre-buffer if available
-            if self._pre_buffer:
-                pre_audio = np.array(list(self._pre_buffer), dtype=np.float32)
+            pre_audio = self._pre_snapshot()
+            if pre_audio is not None:
                 audio = np.concatenate([pre_audio, audio])
-            
+
             self.on_segment_ready(audio)
     
     def add_audio(self, audio: np.ndarray) -> None:
@@ -134,73 +256,135 @@ class StreamingAudioBuffer:
         Args:
             audio: Audio chunk as float32 numpy array (16kHz)
         """
-        current_time = time.time()
-        
-        # Check VAD if enabled
-        is_speech = True
-        if self._vad is not None:
-            is_speech = self._vad.is_speech(audio)
-        
-        with self._lock:
-            if is_speech:
-                # Speech detected
-                if not self._speech_started:
-                    self._speech_started = True
-                    self._speech_start_time = current_time
-                    debug("Buffer: Speech started")
-                
-                self._silence_start_time = None
-                self._buffer.append(audio)
-                self._buffer_samples += len(audio)
-                
+        if self._vad is None:
+            self._process_chunk(audio, True)
+            return
+
+        if self._is_obviously_silent(audio):
+            # Flush any chunks still waiting on a batched VAD decision so
+            # ordering is preserved, then skip inference for this one
+            self._run_pending_vad()
+            self._process_chunk(audio, False)
+            return
+
+        if self.vad_batch_size <= 1:
+            self._process_chunk(audio, self._vad.is_speech(audio))
+            return
+
+        # Batch chunks so one VAD call covers several of them, amortizing
+        # per-call model dispatch overhead
+        self._vad_pending.append(audio)
+        if len(self._vad_pending) >= self.vad_batch_size:
+            self._run_pending_vad()
+
+    def _is_obviously_silent(self, audio: np.ndarray) -> bool:
+        """
+        Cheap energy gate in front of the VAD.
+
+        Tracks the quietest chunk energy seen so far as a noise floor and
+        calls a chunk silent when its energy sits within a small margin of
+        that floor (and below an absolute ceiling). Saves one model call per
+        silent chunk, which is the majority of chunks in real streams.
+        """
+        n = len(audio)
+        if n == 0:
+            return True
+
+        energy = float(np.dot(audio, audio)) / n
+
+        floor = self._energy_floor
+        if floor is None:
+            self._energy_floor = energy
+            return False
+
+        if energy < floor:
+            self._energy_floor = energy
+        else:
+            # Drift slowly upward so the floor recovers from startup
+            # transients and device changes
+            self._energy_floor = floor * 1.001
+
+        # <= so exact digital silence (energy == floor == 0.0, the normal
+        # loopback idle state this gate exists for) is actually gated
+        return energy <= min(self._energy_floor * self.ENERGY_GATE_MARGIN,
+                             self.ENERGY_GATE_CEILING)
+
+    def _run_pending_vad(self) -> None:
+        """Classify and process all chunks waiting on a VAD decision."""
+        if not self._vad_pending:
+            return
+
+        chunks = self._vad_pending
+        self._vad_pending = []
+        if len(chunks) == 1:
+            results = [self._vad.is_speech(chunks[0])]
+        else:
+            results = self._vad.is_speech_batch(chunks)
+
+        # Runs of chunks with the same decision go through the state machine
+        # as one chunk: one ring write and one set of transitions per run
+        # instead of per chunk. (The machine is stateful across calls, so
+        # only runs inside this batch can be coalesced.)
+        start = 0
+        for end in range(1, len(chunks) + 1):
+            if end < len(chunks) and results[end] == results[start]:
+                continue
+            if end - start == 1:
+                self._process_chunk(chunks[start], results[start])
             else:
-                # Silence detected
-                if self._speech_started:
-                    # Still accumulate some silence for natural trailing
-                    self._buffer.append(audio)
-                    self._buffer_samples += len(audio)
-                    
-                    if self._silence_start_time is None:
-                        self._silence_start_time = current_time
-                    
-                    # Check if silence duration exceeds threshold
-                    silence_duration = current_time - self._silence_start_time
-                    if silence_duration > (self.speech_pad_ms / 1000):
-                        # Speech ended, trigger transcription
-                        self._speech_started = False
-                        self._speech_start_time = None
-                        duration = self._get_buffer_duration()
-                        audio_to_process = self._flush_buffer_unlocked()
-                        # Release lock before print/callback to avoid blocking
-                        
-                        if audio_to_process is not None:
-                            debug(f"Buffer: Speech ended, triggering transcription ({duration:.1f}s)")
-                            threading.Thread(
-                                target=self.on_segment_ready,
-                                args=(audio_to_process,),
-                                daemon=True,
-                            ).start()
-                        return
-                else:
-                    # Update pre-buffer with recent silence (for padding)
-                    for sample in audio:
-                        self._pre_buffer.append(sample)
-        
-        # Check max duration (outside lock)
+                self._process_chunk(
+                    np.concatenate(chunks[start:end]), results[start]
+                )
+            start = end
+
+    def _process_chunk(self, audio: np.ndarray, is_speech: bool) -> None:
+        """Run one chunk through the buffering state machine. Producer thread only."""
+        if self._reset_pending:
+            self._apply_reset()
+
+        if is_speech:
+            # Speech detected
+            if not self._speech_started:
+                self._speech_started = True
+                debug("Buffer: Speech started")
+
+            self._silence_samples = 0
+            self._append(audio)
+
+        else:
+            # Silence detected
+            if self._speech_started:
+                # Still accumulate some silence for natural trailing
+                self._append(audio)
+                self._silence_samples += len(audio)
+
+                # Check if silence duration exceeds threshold
+                silence_duration = self._silence_samples / self.SAMPLE_RATE
+                if silence_duration > (self.speech_pad_ms / 1000):
+                    # Speech ended, trigger transcription
+                    self._speech_started = False
+                    self._silence_samples = 0
+                    duration = self._get_buffer_duration()
+                    audio_to_process = self._flush_buffer()
+
+                    if audio_to_process is not None:
+                        debug("Buffer: Speech ended, triggering transcription (%.1fs)", duration)
+                        self._dispatcher.submit(audio_to_process)
+                    return
+            else:
+                # Update pre-buffer with recent silence (for padding)
+                self._pre_append(audio)
+
+        # Check max duration
         buffer_duration = self._get_buffer_duration()
         if buffer_duration >= self.max_segment_duration:
-            with self._lock:
-                self._speech_started = False
-                self._speech_start_time = None
-                audio_to_process = self._flush_buffer_unlocked()
-            
+            self._speech_started = False
+            self._silence_samples = 0
+            audio_to_process = self._flush_buffer()
+
             if audio_to_process is not None:
-                debug(f"Buffer: Max duration reached, triggering transcription ({buffer_duration:.1f}s)")
-                threading.Thread(
-                    target=self.on_segment_ready,
-                    args=(audio_to_process,),
-                    daemon=True,
-                ).start()
+                debug("Buffer: Max duration reached, triggering transcription (%.1fs)", buffer_duration)
+                self._dispatcher.submit(audio_to_process)
             return  # Important: stop processing this chunk
         
         # Note: Removed interim results logic to reduce queue buildup
@@ -208,19 +392,28 @@ class StreamingAudioBuffer:
         # 1. Speech end (silence detected)
         # 2. Max duration reached
     
+    def _apply_reset(self) -> None:
+        """Clear buffer state. Producer thread only."""
+        self._reset_pending = False
+        self._pos = 0
+        self._speech_started = False
+        self._silence_samples = 0
+        self._pre_write = 0
+        self._pre_filled = 0
+        self._vad_pending = []
+
     def reset(self) -> None:
-        """Reset buffer state."""
-        with self._lock:
-            self._buffer = []
-            self._buffer_samples = 0
-            self._speech_started = False
-            self._speech_start_time = None
-            self._silence_start_time = None
-            self._pre_buffer.clear()
-            
+        """
+        Reset buffer state.
+
+        Safe to call from any thread: the actual clearing happens on the
+        producer thread before its next chunk, so it never races the hot path.
+        """
+        self._reset_pending = True
+
         if self._vad is not None:
             self._vad.reset()
-        
+
         debug("Buffer: Reset")
 
 
@@ -247,32 +440,36 @@ class SimpleAudioBuffer:
         """
         self.on_segment_ready = on_segment_ready
         self.segment_duration = segment_duration
-        
-        self._buffer: List[np.ndarray] = []
-        self._buffer_samples = 0
+
         self._target_samples = int(self.SAMPLE_RATE * segment_duration)
+        # Fixed target means the segment size is known up front: blit chunks
+        # into a preallocated ring instead of list append + concatenate
+        self._ring = np.empty(self._target_samples + 4096, dtype=np.float32)
+        self._pos = 0
         self._lock = threading.Lock()
-    
+        self._dispatcher = _SegmentDispatcher(on_segment_ready)
+
     def add_audio(self, audio: np.ndarray) -> None:
         """Add audio chunk to buffer."""
         with self._lock:
-            self._buffer.append(audio)
-            self._buffer_samples += len(audio)
-            
-            if self._buffer_samples >= self._target_samples:
-                audio_data = np.concatenate(self._buffer)
-                self._buffer = []
-                self._buffer_samples = 0
-                
-                # Trigger in background thread
-                threading.Thread(
-                    target=self.on_segment_ready,
-                    args=(audio_data,),
-                    daemon=True,
-                ).start()
-    
+            n = len(audio)
+            free = len(self._ring) - self._pos
+            if n > free:
+                n = free
+                audio = audio[:n]
+            self._ring[self._pos:self._pos + n] = audio
+            self._pos += n
+
+            if self._pos < self._target_samples:
+                return
+
+            audio_data = self._ring[:self._pos].copy()
+            self._pos = 0
+
+        # Hand off outside the lock
+        self._dispatcher.submit(audio_data)
+
     def reset(self) -> None:
         """Reset buffer."""
         with self._lock:
-            self._buffer = []
-            self._buffer_samples = 0
+            self._pos = 0
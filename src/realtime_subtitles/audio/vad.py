@@ -43,8 +43,10 @@ class VoiceActivityDetector:
         self._speech_ms = 0
         self._silence_ms = 0
         
-        # Audio buffer
-        self._buffer = np.array([], dtype=np.float32)
+        # Partial-window carry between calls: at most one model hop of
+        # samples, so no per-call np.concatenate of the whole backlog
+        self._residual = np.empty(self.CHUNK_SIZE, dtype=np.float32)
+        self._residual_len = 0
         
         # Model
         self._model = None
@@ -71,63 +73,139 @@ class VoiceActivityDetector:
         if len(chunk) != self.CHUNK_SIZE:
             return 0.0
         
-        tensor = torch.from_numpy(chunk.astype(np.float32))
+        tensor = torch.from_numpy(np.ascontiguousarray(chunk, dtype=np.float32))
         
         with torch.no_grad():
             prob = self._model(tensor, self.SAMPLE_RATE).item()
         
         return prob
     
+    def _carve_windows(self, audio: np.ndarray) -> list:
+        """
+        Split audio into complete 512-sample windows, carrying the remainder.
+
+        Whole windows inside the chunk are returned as views (no copy); only
+        the window completed from the previous call's residual is copied.
+        """
+        windows = []
+        n = len(audio)
+        offset = 0
+
+        if self._residual_len:
+            take = min(self.CHUNK_SIZE - self._residual_len, n)
+            self._residual[self._residual_len:self._residual_len + take] = audio[:take]
+            self._residual_len += take
+            offset = take
+            if self._residual_len == self.CHUNK_SIZE:
+                windows.append(self._residual.copy())
+                self._residual_len = 0
+            else:
+                return windows
+
+        whole = (n - offset) // self.CHUNK_SIZE * self.CHUNK_SIZE
+        if whole:
+            block = audio[offset:offset + whole]
+            windows.extend(block.reshape(-1, self.CHUNK_SIZE))
+            offset += whole
+
+        rest = n - offset
+        if rest:
+            self._residual[:rest] = audio[offset:]
+            self._residual_len = rest
+
+        return windows
+
+    def _apply_window(self, prob: float, window_duration_ms: float) -> None:
+        """Advance the hysteresis state machine by one 512-sample window."""
+        if prob >= self.threshold:
+            # Speech detected
+            self._speech_ms += window_duration_ms
+            self._silence_ms = 0
+
+            if self._speech_ms >= self.min_speech_duration_ms:
+                self._is_speech = True
+        else:
+            # Silence detected
+            self._silence_ms += window_duration_ms
+
+            if self._silence_ms >= self.min_silence_duration_ms:
+                self._is_speech = False
+                self._speech_ms = 0
+
     def is_speech(self, audio: np.ndarray) -> bool:
         """
         Check if audio contains speech.
-        
+
         Accumulates audio internally and processes in 512-sample chunks.
         Uses hysteresis to avoid rapid state changes.
-        
+
         Args:
             audio: Audio samples as float32 numpy array (any length)
-            
+
         Returns:
             True if currently in speech state
         """
-        # Accumulate audio
-        self._buffer = np.concatenate([
-            self._buffer,
-            audio.astype(np.float32)
-        ])
-        
-        # Process all complete chunks
         chunk_duration_ms = (self.CHUNK_SIZE / self.SAMPLE_RATE) * 1000  # 32ms
-        
-        while len(self._buffer) >= self.CHUNK_SIZE:
-            chunk = self._buffer[:self.CHUNK_SIZE]
-            self._buffer = self._buffer[self.CHUNK_SIZE:]
-            
-            prob = self._get_probability(chunk)
-            
-            if prob >= self.threshold:
-                # Speech detected
-                self._speech_ms += chunk_duration_ms
-                self._silence_ms = 0
-                
-                if self._speech_ms >= self.min_speech_duration_ms:
-                    self._is_speech = True
-            else:
-                # Silence detected
-                self._silence_ms += chunk_duration_ms
-                
-                if self._silence_ms >= self.min_silence_duration_ms:
-                    self._is_speech = False
-                    self._speech_ms = 0
-        
+
+        # astype with copy=False: capture already delivers float32, so this
+        # is a view in the common case
+        for window in self._carve_windows(audio.astype(np.float32, copy=False)):
+            prob = self._get_probability(window)
+            self._apply_window(prob, chunk_duration_ms)
+
         return self._is_speech
+
+    def is_speech_batch(self, chunks: list) -> list:
+        """
+        Check several chunks at once, amortizing per-call setup.
+
+        Every complete 512-sample window across the batch runs through the
+        stateful model under a single no_grad block — unlike Silero's
+        audio_forward, which resets the recurrent state on entry and would
+        make batched probabilities diverge from the streaming is_speech()
+        path. The same hysteresis state machine is then applied per window.
+
+        Args:
+            chunks: List of float32 numpy arrays (any lengths)
+
+        Returns:
+            One bool per input chunk: the speech state after that chunk
+        """
+        # Slice each chunk into complete windows, remembering how many
+        # windows belong to each chunk so per-chunk states line up
+        window_counts = []
+        windows = []
+        for chunk in chunks:
+            carved = self._carve_windows(chunk.astype(np.float32, copy=False))
+            windows.extend(carved)
+            window_counts.append(len(carved))
+
+        probs = []
+        if windows:
+            with torch.no_grad():
+                for window in windows:
+                    tensor = torch.from_numpy(
+                        np.ascontiguousarray(window, dtype=np.float32)
+                    )
+                    probs.append(self._model(tensor, self.SAMPLE_RATE).item())
+
+        chunk_duration_ms = (self.CHUNK_SIZE / self.SAMPLE_RATE) * 1000  # 32ms
+
+        results = []
+        index = 0
+        for count in window_counts:
+            for prob in probs[index:index + count]:
+                self._apply_window(prob, chunk_duration_ms)
+            index += count
+            results.append(self._is_speech)
+
+        return results
     
     def reset(self) -> None:
         """Reset VAD state."""
         self._is_speech = False
         self._speech_ms = 0
         self._silence_ms = 0
-        self._buffer = np.array([], dtype=np.float32)
+        self._residual_len = 0
         if self._model is not None:
             self._model.reset_states()
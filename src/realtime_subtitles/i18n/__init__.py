@@ -4,19 +4,63 @@ Internationalization (i18n) module for Real-time Subtitles.
 Provides multi-language support for the UI.
 """
 
-from typing import Dict, Optional
+import importlib
+import sys
+import types
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import Optional
 from realtime_subtitles.settings_manager import get_settings_manager
 
-# Import translation modules
-from . import zh_TW
-from . import zh_CN
-from . import en
 
-# Available languages
+def _freeze(translations: dict) -> Mapping:
+    """
+    Return a read-only view of a translation table with interned strings.
+
+    Interned keys make every lookup a pointer compare before falling back
+    to hash-and-equality, and the proxy lets all threads share one mapping
+    without defensive copies. Values are interned too: strings identical
+    across locales ("ARIA", engine names, language labels) collapse to a
+    single object instead of one copy per locale.
+    """
+    return types.MappingProxyType(
+        {sys.intern(key): sys.intern(value) for key, value in translations.items()}
+    )
+
+
+class _LazyTranslations(Mapping):
+    """
+    Translation table that imports its locale module on first access.
+
+    Startup only pays the parse/allocation cost for the locale actually
+    in use instead of every locale shipped.
+    """
+
+    def __init__(self, lang_code: str):
+        self._lang_code = lang_code
+        self._table: Optional[Mapping] = None
+
+    def _load(self) -> Mapping:
+        if self._table is None:
+            module = importlib.import_module(f".{self._lang_code}", __name__)
+            self._table = _freeze(module.TRANSLATIONS)
+        return self._table
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+
+# Available languages (translation tables load lazily on first use)
 LANGUAGES = {
-    "zh_TW": ("繁體中文", zh_TW.TRANSLATIONS),
-    "zh_CN": ("简体中文", zh_CN.TRANSLATIONS),
-    "en": ("English", en.TRANSLATIONS),
+    "zh_TW": ("繁體中文", _LazyTranslations("zh_TW")),
+    "zh_CN": ("简体中文", _LazyTranslations("zh_CN")),
+    "en": ("English", _LazyTranslations("en")),
 }
 
 # Default language
@@ -24,7 +68,6 @@ DEFAULT_LANGUAGE = "zh_CN"
 
 # Current language cache
 _current_language: Optional[str] = None
-_translations: Dict[str, str] = {}
 
 
 def get_current_language() -> str:
@@ -43,20 +86,49 @@ def set_language(lang_code: str) -> None:
     Args:
         lang_code: Language code (zh_TW, zh_CN, en)
     """
-    global _current_language, _translations
-    
+    global _current_language
+
     if lang_code not in LANGUAGES:
         lang_code = DEFAULT_LANGUAGE
-    
+
     _current_language = lang_code
-    _translations = LANGUAGES[lang_code][1]
-    
+    hot.refresh(lang_code)
+
     # Save to settings
     settings = get_settings_manager()
     settings.set("ui_language", lang_code)
     settings.save()
 
 
+class _HotStrings:
+    """
+    Pre-resolved strings for keys read on every overlay refresh.
+
+    The paint path reads these as plain attributes — no dict lookup, no
+    fallback logic. Repopulated on language switch.
+    """
+
+    __slots__ = ("overlay_waiting", "overlay_translation_waiting")
+
+    def refresh(self, lang_code: str) -> None:
+        self.overlay_waiting = _lookup(lang_code, "overlay_waiting")
+        self.overlay_translation_waiting = _lookup(
+            lang_code, "overlay_translation_waiting"
+        )
+
+
+hot = _HotStrings()
+
+
+@lru_cache(maxsize=512)
+def _lookup(lang_code: str, key: str) -> str:
+    """Resolve a key in a locale, falling back to the key itself."""
+    entry = LANGUAGES.get(lang_code)
+    if entry is None:
+        entry = LANGUAGES[DEFAULT_LANGUAGE]
+    return entry[1].get(key, key)
+
+
 def get_text(key: str, **kwargs) -> str:
     """
     Get translated text for a key.
@@ -68,15 +140,11 @@ def get_text(key: str, **kwargs) -> str:
     Returns:
         Translated string, or key if not found
     """
-    global _translations
-    
-    # Initialize translations if not loaded
-    if not _translations:
-        lang = get_current_language()
-        _translations = LANGUAGES.get(lang, LANGUAGES[DEFAULT_LANGUAGE])[1]
-    
-    text = _translations.get(key, key)
-    
+    # Memoized on (language, key); tables are immutable, so entries never
+    # go stale even across language switches. Templates are cached raw and
+    # formatted per call.
+    text = _lookup(get_current_language(), key)
+
     # Apply format arguments if provided
     if kwargs:
         try:
@@ -99,3 +167,6 @@ def get_language_options() -> list:
 
 # Convenience alias
 t = get_text
+
+# Resolve the hot strings for the active language up front
+hot.refresh(get_current_language())
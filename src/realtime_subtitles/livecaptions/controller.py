@@ -3,7 +3,9 @@ Windows LiveCaptions Controller
 Automatically launch and configure LiveCaptions
 """
 
+import functools
 import os
+import sys
 import time
 from typing import Optional
 
@@ -14,36 +16,57 @@ except ImportError:
     PYAUTOGUI_AVAILABLE = False
     pyautogui = None
 
-try:
-    import uiautomation as auto
-    UIAUTOMATION_AVAILABLE = True
-except ImportError:
-    UIAUTOMATION_AVAILABLE = False
-    auto = None
-
 from ..logger import info, debug, warning, error
 
 
+@functools.lru_cache(maxsize=1)
+def _screen_size() -> tuple:
+    """Primary screen dimensions, cached — these are user32 syscalls and
+    the resolution effectively never changes mid-session."""
+    import win32api
+    return win32api.GetSystemMetrics(0), win32api.GetSystemMetrics(1)
+
+
+@functools.lru_cache(maxsize=1)
+def _is_windows_11() -> bool:
+    """Windows 11 check, computed once — the OS doesn't change at runtime."""
+    if sys.platform != "win32":
+        return False
+    # Windows 11 is build >= 22000; getwindowsversion reads the struct
+    # straight from the OS, no version-string parsing
+    return sys.getwindowsversion().build >= 22000
+
+
 class LiveCaptionsController:
     """
     Controls the launch and configuration of Windows LiveCaptions
     """
-    
+
+    # Cached LiveCaptions window handle. UI Automation tree walks are COM
+    # round-trips; a raw FindWindow is one syscall and the handle stays
+    # valid until the window is destroyed.
+    _cached_hwnd: Optional[int] = None
+
+    @classmethod
+    def _get_hwnd(cls) -> Optional[int]:
+        """Get the LiveCaptions window handle, reusing the cache while valid."""
+        try:
+            import win32gui
+        except ImportError:
+            return None
+
+        hwnd = cls._cached_hwnd
+        if hwnd and win32gui.IsWindow(hwnd):
+            return hwnd
+
+        hwnd = win32gui.FindWindow("LiveCaptionsDesktopWindow", None)
+        cls._cached_hwnd = hwnd or None
+        return cls._cached_hwnd
+
     @staticmethod
     def is_windows_11() -> bool:
         """Check if running on Windows 11"""
-        try:
-            import platform
-            version = platform.version()
-            # Windows 11 build number >= 10.0.22000
-            parts = version.split('.')
-            if len(parts) >= 3:
-                build = int(parts[2].split('-')[0])  # Handle format like "10.0.22000-xxx"
-                return build >= 22000
-            return False
-        except Exception as e:
-            warning(f"LiveCaptionsController: Error checking Windows version: {e}")
-            return False
+        return _is_windows_11()
     
     @staticmethod
     def is_livecaptions_available() -> bool:
@@ -87,22 +110,15 @@ class LiveCaptionsController:
                 # Restore fail-safe setting
                 pyautogui.FAILSAFE = original_failsafe
             
-            # Wait for window to appear
-            time.sleep(2)
-            
-            # Verify window appeared
-            if UIAUTOMATION_AVAILABLE:
-                try:
-                    window = auto.WindowControl(
-                        searchDepth=1,
-                        Name="Live Captions"
-                    )
-                    if window.Exists(0, 0):
-                        info("LiveCaptionsController: LiveCaptions window found")
-                        return True
-                except:
-                    pass
-            
+            # Wait for the window with a backed-off poll (~2s budget) instead
+            # of a fixed 2s sleep; fast machines exit in the first few steps
+            # and the discovered handle lands in the shared HWND cache
+            for delay in (0.05, 0.1, 0.2, 0.4, 0.5, 0.5, 0.3):
+                time.sleep(delay)
+                if LiveCaptionsController._get_hwnd():
+                    info("LiveCaptionsController: LiveCaptions window found")
+                    return True
+
             # Even if verification fails, return success (may have launched but positioning failed)
             return True
             
@@ -121,41 +137,19 @@ class LiveCaptionsController:
         Returns:
             bool: Whether minimizing was successful
         """
-        if not UIAUTOMATION_AVAILABLE:
-            warning("LiveCaptionsController: uiautomation not available")
-            return False
-        
         try:
             import win32gui
             import win32con
-            
-            # Find window by class name
-            hwnd = win32gui.FindWindow("LiveCaptionsDesktopWindow", None)
+
+            hwnd = LiveCaptionsController._get_hwnd()
             if hwnd:
                 # Minimize to taskbar
                 win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
                 debug("LiveCaptionsController: Window minimized")
                 return True
-            else:
-                # Try with uiautomation
-                window = auto.WindowControl(
-                    searchDepth=1, 
-                    ClassName="LiveCaptionsDesktopWindow"
-                )
-                if window.Exists(0, 0):
-                    # Move to bottom-right corner and make it small
-                    try:
-                        import win32api
-                        screen_width = win32api.GetSystemMetrics(0)
-                        screen_height = win32api.GetSystemMetrics(1)
-                        window.MoveWindow(screen_width - 50, screen_height - 50, 1, 1)
-                        debug("LiveCaptionsController: Window moved to corner")
-                        return True
-                    except:
-                        pass
-                
-                warning("LiveCaptionsController: Window not found for minimizing")
-                return False
+
+            warning("LiveCaptionsController: Window not found for minimizing")
+            return False
         except Exception as e:
             warning(f"LiveCaptionsController: Failed to minimize window: {e}")
             # Fallback: keep window visible
@@ -174,23 +168,18 @@ class LiveCaptionsController:
         Returns:
             bool: Whether hiding was successful
         """
-        if not UIAUTOMATION_AVAILABLE:
-            warning("LiveCaptionsController: uiautomation not available")
-            return False
-        
         try:
-            window = auto.WindowControl(
-                searchDepth=1, 
-                ClassName="LiveCaptionsDesktopWindow"
-            )
-            if window.Exists(0, 0):
+            import win32gui
+
+            hwnd = LiveCaptionsController._get_hwnd()
+            if hwnd:
                 # Move window off-screen
-                window.MoveWindow(-10000, -10000, 1, 1)
+                win32gui.MoveWindow(hwnd, -10000, -10000, 1, 1, True)
                 debug("LiveCaptionsController: Window hidden")
                 return True
-            else:
-                warning("LiveCaptionsController: Window not found for hiding")
-                return False
+
+            warning("LiveCaptionsController: Window not found for hiding")
+            return False
         except Exception as e:
             warning(f"LiveCaptionsController: Failed to hide window: {e}")
             return False
@@ -205,35 +194,28 @@ class LiveCaptionsController:
         Returns:
             bool: Whether showing was successful
         """
-        if not UIAUTOMATION_AVAILABLE:
-            warning("LiveCaptionsController: uiautomation not available")
-            return False
-        
         try:
-            window = auto.WindowControl(
-                searchDepth=1, 
-                ClassName="LiveCaptionsDesktopWindow"
-            )
-            if window.Exists(0, 0):
+            import win32gui
+
+            hwnd = LiveCaptionsController._get_hwnd()
+            if hwnd:
                 # Get screen size and move window to bottom center
                 try:
-                    import win32api
-                    screen_width = win32api.GetSystemMetrics(0)
-                    screen_height = win32api.GetSystemMetrics(1)
-                    
+                    screen_width, screen_height = _screen_size()
+
                     # Move to bottom center
                     x = (screen_width - 600) // 2
                     y = screen_height - 200
-                    window.MoveWindow(x, y, 600, 150)
-                except:
+                    win32gui.MoveWindow(hwnd, x, y, 600, 150, True)
+                except Exception:
                     # If unable to get screen size, move to fixed position
-                    window.MoveWindow(500, 800, 600, 150)
-                
+                    win32gui.MoveWindow(hwnd, 500, 800, 600, 150, True)
+
                 debug("LiveCaptionsController: Window shown")
                 return True
-            else:
-                warning("LiveCaptionsController: Window not found for showing")
-                return False
+
+            warning("LiveCaptionsController: Window not found for showing")
+            return False
         except Exception as e:
             warning(f"LiveCaptionsController: Failed to show window: {e}")
             return False
@@ -246,17 +228,7 @@ class LiveCaptionsController:
         Returns:
             bool: Whether it's running
         """
-        if not UIAUTOMATION_AVAILABLE:
-            return False
-        
-        try:
-            window = auto.WindowControl(
-                searchDepth=1, 
-                ClassName="LiveCaptionsDesktopWindow"
-            )
-            return window.Exists(0, 0)
-        except:
-            return False
+        return LiveCaptionsController._get_hwnd() is not None
 
 
 # Simple test
@@ -8,7 +8,12 @@ Simplified logic:
 4. When draft accumulates enough SOURCE sentences, promote them to committed.
 """
 
+import asyncio
 import re
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from typing import List, Tuple, Optional, Callable
 from dataclasses import dataclass, field
@@ -23,7 +28,71 @@ except ImportError:
     def warning(msg): print(f"[WARN] {msg}")
 
 
-@dataclass
+# Sentence-delimiter pattern, compiled once at module load
+_SENTENCE_RE = re.compile(r'[.。？！?!\n，,、]')
+
+# Optional Numba-accelerated similarity used by _find_committed_end.
+# Falls back to difflib when numba/numpy are not installed.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _trigram_dice(a, b):
+        """Dice coefficient over character trigrams of two uint32 arrays."""
+        na = a.shape[0] - 2
+        nb = b.shape[0] - 2
+        if na <= 0 or nb <= 0:
+            return 0.0
+
+        ha = _np.empty(na, dtype=_np.uint64)
+        for i in range(na):
+            ha[i] = (
+                (_np.uint64(a[i]) * _np.uint64(1000003) + _np.uint64(a[i + 1]))
+                * _np.uint64(1000003) + _np.uint64(a[i + 2])
+            )
+        hb = _np.empty(nb, dtype=_np.uint64)
+        for i in range(nb):
+            hb[i] = (
+                (_np.uint64(b[i]) * _np.uint64(1000003) + _np.uint64(b[i + 1]))
+                * _np.uint64(1000003) + _np.uint64(b[i + 2])
+            )
+
+        ha.sort()
+        hb.sort()
+        inter = 0
+        i = 0
+        j = 0
+        while i < na and j < nb:
+            if ha[i] == hb[j]:
+                inter += 1
+                i += 1
+                j += 1
+            elif ha[i] < hb[j]:
+                i += 1
+            else:
+                j += 1
+
+        return 2.0 * inter / (na + nb)
+
+    def _encode_for_match(s: str):
+        """Encode a string as a uint32 codepoint array for the kernel."""
+        return _np.frombuffer(s.encode('utf-32-le'), dtype=_np.uint32)
+
+    # Compile and warm at import so the JIT cost never lands on a poll;
+    # any JIT failure just disables the fast path
+    try:
+        _warm = _encode_for_match("warm up")
+        _trigram_dice(_warm, _warm)
+    except Exception:
+        _trigram_dice = None
+
+except ImportError:
+    _trigram_dice = None
+    _encode_for_match = None
+
+
+@dataclass(slots=True)
 class TranslationState:
     """Represents the current translation state."""
     committed_text: str = ""  # White text (stable, translated)
@@ -56,31 +125,227 @@ class TranslationStateManager:
     
     # Fuzzy matching threshold
     FUZZY_THRESHOLD = 0.65  # 65% similarity = match (Lowered for stability)
+
+    # Minimum sentence length for the trigram kernel. FUZZY_THRESHOLD was
+    # calibrated for SequenceMatcher.ratio, and trigram Dice diverges from
+    # it badly on short CJK clauses (a one-character ASR revision of a
+    # 6-char clause scores ~0.7 on ratio but ~0.2 on Dice), spuriously
+    # diverging the committed prefix. Short sentences take the difflib
+    # path, where the kernel's win is negligible anyway.
+    TRIGRAM_MIN_CHARS = 15
     
     # Max draft size (sentences) to prevent huge translation requests
     # MUST be >= DRAFT_COMMIT_THRESHOLD to avoid skipping sentences
     MAX_DRAFT_SENTENCES = 8
+
+    # LRU cache size for translator results
+    TRANSLATION_CACHE_SIZE = 64
+
+    # Delimiter for piggybacking two texts on one translator round-trip
+    BATCH_DELIMITER = "\n\n§§§\n\n"
+
+    # Fixed attribute set: slot storage is smaller and faster to access
+    # than a per-instance __dict__ on this 10 Hz hot path
+    __slots__ = (
+        'translator', 'async_translator', '_loop', '_loop_thread',
+        '_sentence_re', '_committed_sources', '_committed_sources_lower',
+        '_committed_sources_enc', '_committed_norm', '_committed_paragraphs',
+        '_draft_sources', '_draft_translation', '_last_processed_text',
+        '_last_processed_hash', '_translation_cache', '_executor',
+        '_draft_seq', '_sm', '_sm_seq2', '_last_draft_tuple',
+        '_last_draft_text', '_segment_prefix', '_segment_prefix_end',
+        '_segment_closed',
+    )
     
     def __init__(
         self,
         translator: Optional[Callable[[str], str]] = None,
+        async_translator: Optional[Callable] = None,
     ):
         """
         Initialize the manager.
         
         Args:
             translator: Function to translate text (source -> target)
+            async_translator: Optional coroutine function doing the same.
+                             When given, translations run on a persistent
+                             event loop and the two per-commit requests
+                             overlap at the network level.
         """
         self.translator = translator
+        self.async_translator = async_translator
+
+        # Event loop thread for the async backend (only when one is given)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        if async_translator is not None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="tsm-async", daemon=True
+            )
+            self._loop_thread.start()
+
+        # Precompiled delimiter pattern; rebuilt only when a subclass
+        # overrides SENTENCE_DELIMITERS
+        if self.SENTENCE_DELIMITERS == _SENTENCE_RE.pattern:
+            self._sentence_re = _SENTENCE_RE
+        else:
+            self._sentence_re = re.compile(self.SENTENCE_DELIMITERS)
         
         # Committed state
         self._committed_sources: List[str] = []    # Source sentences that are locked
+        self._committed_sources_lower: List[str] = []  # Lowercased mirror for fuzzy matching
+        self._committed_sources_enc: List = []     # Encoded mirror for the numba kernel
+        self._committed_norm: str = ""             # Normalized join for the exact-prefix fast path
         self._committed_paragraphs: List[str] = [] # Translation paragraphs (each commit batch = 1 paragraph)
         
-        # Draft state (volatile, overwritten each update)
-        self._draft_sources: List[str] = []        # Source sentences pending
+        # Draft state (volatile, overwritten each update).
+        # A deque: committing pops from the left in O(1) instead of
+        # allocating two list slices per commit cycle.
+        self._draft_sources: deque = deque()       # Source sentences pending
         self._draft_translation: str = ""          # Translation of draft sources
         self._last_processed_text: str = ""        # Cache for duplicate detection
+        self._last_processed_hash: int = hash("")  # Hash of the rstripped text
+
+        # Translator result LRU: LiveCaptions re-emits near-identical text
+        # many times per second, so most polls resolve here instead of
+        # paying a translator round-trip
+        self._translation_cache: OrderedDict = OrderedDict()
+
+        # Background draft translation: process_text never blocks on the
+        # translator for the draft; a newer submission supersedes any
+        # in-flight one via the sequence number
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="tsm-translate"
+        )
+        self._draft_seq = 0
+
+        # Shared SequenceMatcher: set_seq2 keeps its b2j index across the
+        # committed-sentence loop, where many seq1 values are compared
+        # against the same candidate. autojunk off — these are short
+        # sentences, not documents.
+        self._sm = SequenceMatcher(None, "", "", autojunk=False)
+        self._sm_seq2: Optional[str] = None
+
+        # Last joined draft, reused while the draft tuple is unchanged
+        self._last_draft_tuple: tuple = ()
+        self._last_draft_text: str = ""
+
+        # Incremental segmentation cache: sentences before the last
+        # delimiter of the previous text are final and get reused
+        self._segment_prefix: str = ""
+        self._segment_prefix_end: int = 0
+        self._segment_closed: List[str] = []
+
+    def _store_translation(self, source: str, translated: str) -> None:
+        """Insert a result into the LRU cache, evicting the oldest entry."""
+        self._translation_cache[source] = translated
+        if len(self._translation_cache) > self.TRANSLATION_CACHE_SIZE:
+            self._translation_cache.popitem(last=False)
+
+    def _call_translator(self, text: str) -> str:
+        """Invoke whichever translator backend is configured."""
+        if self.async_translator is not None:
+            future = asyncio.run_coroutine_threadsafe(
+                self.async_translator(text), self._loop
+            )
+            return future.result() or ""
+        return self.translator(text) or ""
+
+    def _translate_cached(self, text: str) -> str:
+        """Translate through a small LRU cache keyed on the exact source."""
+        cached = self._translation_cache.get(text)
+        if cached is not None:
+            self._translation_cache.move_to_end(text)
+            return cached
+
+        translated = self._call_translator(text)
+        self._store_translation(text, translated)
+        return translated
+
+    async def _gather_pair(self, first: str, second: str):
+        """Run both translation coroutines concurrently."""
+        return await asyncio.gather(
+            self.async_translator(first), self.async_translator(second)
+        )
+
+    def _submit_draft_translation(self, draft_text: str) -> None:
+        """Translate the draft without blocking; newest submission wins."""
+        cached = self._translation_cache.get(draft_text)
+        if cached is not None:
+            self._translation_cache.move_to_end(draft_text)
+            self._draft_translation = cached
+            return
+
+        self._draft_seq += 1
+        try:
+            self._executor.submit(self._draft_translation_job, draft_text, self._draft_seq)
+        except RuntimeError:
+            # Executor already shut down (pipeline stopping); nothing to do
+            pass
+
+    def _draft_translation_job(self, draft_text: str, seq: int) -> None:
+        """Worker-side draft translation; discards superseded results."""
+        try:
+            translated = self._translate_cached(draft_text)
+        except Exception as e:
+            warning(f"TSM: Translation error: {e}")
+            return
+
+        if seq == self._draft_seq:
+            self._draft_translation = translated
+
+    def _translate_pair(self, first: str, second: str) -> Tuple[str, str]:
+        """
+        Translate two pieces with one translator round-trip when possible.
+
+        Prefers a native translate_batch if the translator exposes one;
+        otherwise joins both pieces with BATCH_DELIMITER and splits the
+        result, falling back to two separate calls if the delimiter does
+        not survive translation.
+        """
+        if not second:
+            return self._translate_cached(first), ""
+
+        cached_first = self._translation_cache.get(first)
+        cached_second = self._translation_cache.get(second)
+        if cached_first is not None and cached_second is not None:
+            self._translation_cache.move_to_end(first)
+            self._translation_cache.move_to_end(second)
+            return cached_first, cached_second
+
+        if self.async_translator is not None:
+            # Fire both requests on the shared loop so they overlap on the
+            # network instead of running back to back
+            future = asyncio.run_coroutine_threadsafe(
+                self._gather_pair(first, second), self._loop
+            )
+            out_first, out_second = future.result()
+            out_first = out_first or ""
+            out_second = out_second or ""
+            self._store_translation(first, out_first)
+            self._store_translation(second, out_second)
+            return out_first, out_second
+
+        translate_batch = getattr(self.translator, "translate_batch", None)
+        if callable(translate_batch):
+            results = translate_batch([first, second])
+            if results and len(results) == 2:
+                out_first = results[0] or ""
+                out_second = results[1] or ""
+                self._store_translation(first, out_first)
+                self._store_translation(second, out_second)
+                return out_first, out_second
+
+        combined = self.translator(f"{first}{self.BATCH_DELIMITER}{second}") or ""
+        parts = combined.split("§§§")
+        if len(parts) == 2:
+            out_first = parts[0].strip()
+            out_second = parts[1].strip()
+            self._store_translation(first, out_first)
+            self._store_translation(second, out_second)
+            return out_first, out_second
+
+        return self._translate_cached(first), self._translate_cached(second)
     
     def process_text(self, full_source_text: str) -> TranslationState:
         """
@@ -95,8 +360,17 @@ class TranslationStateManager:
         # Duplicate check: If text hasn't changed, don't re-process
         if full_source_text == self._last_processed_text:
             return self._build_state()
-            
+
+        # LiveCaptions sometimes re-emits the same text with only trailing
+        # whitespace changed; one hash of the rstripped text catches that
+        # before any segmentation work
+        stripped_hash = hash(full_source_text.rstrip())
+        if stripped_hash == self._last_processed_hash:
+            self._last_processed_text = full_source_text
+            return self._build_state()
+
         self._last_processed_text = full_source_text
+        self._last_processed_hash = stripped_hash
         
         if not full_source_text or not full_source_text.strip():
             return self._build_state()
@@ -128,24 +402,31 @@ class TranslationStateManager:
             # Add skipped part to committed sources so we match them next time
             # But DO NOT add to committed_paragraphs (hiding them from UI)
             self._committed_sources.extend(skipped_part)
+            self._committed_sources_lower.extend(s.lower() for s in skipped_part)
+            if _trigram_dice is not None:
+                self._committed_sources_enc.extend(
+                    _encode_for_match(s.lower()) for s in skipped_part
+                )
+            self._committed_norm = " ".join(self._committed_sources_lower)
             warning(f"TSM: Draft too large ({skipped_count+len(draft_sources)}), skipped {skipped_count} sentences.")
             
-        self._draft_sources = draft_sources
+        self._draft_sources = deque(draft_sources)
         
         if not draft_sources:
             # No new content, just return current state
             self._draft_translation = ""
             return self._build_state()
         
-        # OVERWRITE draft: translate entire draft portion
-        if self.translator:
-            try:
-                draft_text = " ".join(draft_sources)
-                translated = self.translator(draft_text)
-                self._draft_translation = translated or ""
-            except Exception as e:
-                warning(f"TSM: Translation error: {e}")
-                self._draft_translation = ""
+        # OVERWRITE draft: translate the entire draft portion. Cache hits
+        # apply synchronously; misses run on the background worker so this
+        # poll returns immediately with the previous draft translation and
+        # the fresh one lands on a later poll.
+        if self.translator or self.async_translator:
+            draft_tuple = tuple(draft_sources)
+            if draft_tuple != self._last_draft_tuple:
+                self._last_draft_tuple = draft_tuple
+                self._last_draft_text = " ".join(draft_sources)
+            self._submit_draft_translation(self._last_draft_text)
         
         # Check if we should commit some draft
         self._check_commit_threshold()
@@ -153,12 +434,50 @@ class TranslationStateManager:
         return self._build_state()
     
     def _segment_sentences(self, text: str) -> List[str]:
-        """Split text into sentences."""
+        """
+        Split text into sentences, reusing work from the previous call.
+
+        LiveCaptions grows its buffer by a few characters between polls,
+        so sentences that ended before the last delimiter of the previous
+        text are final: reuse them and only re-split the tail. Falls back
+        to a full split whenever the text diverges (LiveCaptions reset).
+        """
+        if not text:
+            return []
+
+        if self._segment_prefix and text.startswith(self._segment_prefix):
+            tail_start = self._segment_prefix_end
+            head_sentences = self._segment_closed
+        else:
+            tail_start = 0
+            head_sentences = []
+
+        tail_sentences = self._split_parts(text[tail_start:])
+        sentences = head_sentences + tail_sentences if head_sentences else tail_sentences
+
+        # Advance the closed-prefix cache to the last delimiter seen
+        last = None
+        for last in self._sentence_re.finditer(text, tail_start):
+            pass
+        if last is not None:
+            closed_tail = self._split_parts(text[tail_start:last.end()])
+            self._segment_closed = head_sentences + closed_tail
+            self._segment_prefix = text[:last.end()]
+            self._segment_prefix_end = last.end()
+        elif tail_start == 0:
+            self._segment_closed = []
+            self._segment_prefix = ""
+            self._segment_prefix_end = 0
+
+        return sentences
+
+    def _split_parts(self, text: str) -> List[str]:
+        """Split a piece of text into sentences (full, non-incremental)."""
         if not text:
             return []
         
         # Split by sentence delimiters
-        parts = re.split(self.SENTENCE_DELIMITERS, text)
+        parts = self._sentence_re.split(text)
         
         sentences = []
         for part in parts:
@@ -166,14 +485,16 @@ class TranslationStateManager:
             if not part:
                 continue
             
-            # If part is too long, split by length
+            # If part is too long, split by length. Sentences are interned:
+            # the same strings recur across polls, so duplicates collapse to
+            # one object and downstream comparisons become pointer checks.
             if len(part) > self.MAX_SENTENCE_LENGTH:
                 for i in range(0, len(part), self.MAX_SENTENCE_LENGTH):
                     chunk = part[i:i + self.MAX_SENTENCE_LENGTH].strip()
                     if chunk:
-                        sentences.append(chunk)
+                        sentences.append(sys.intern(chunk))
             else:
-                sentences.append(part)
+                sentences.append(sys.intern(part))
         
         return sentences
     
@@ -185,49 +506,122 @@ class TranslationStateManager:
         """
         if not self._committed_sources:
             return 0  # No committed content, everything is draft
+
+        # Fast path: in the steady state the committed sentences reappear
+        # verbatim at the head of the new text, so one normalized string
+        # compare (length- and first-difference-short-circuited) replaces
+        # N fuzzy matches
+        count = len(self._committed_sources)
+        if len(source_sentences) >= count:
+            candidate = " ".join(s.lower() for s in source_sentences[:count])
+            if candidate == self._committed_norm:
+                return count
         
-        # Try to match committed sources in order
+        # Try to match committed sources in order (lowercased forms are
+        # cached alongside the committed list; candidates are lowercased at
+        # most once each as matched_count advances)
         matched_count = 0
-        for i, committed_src in enumerate(self._committed_sources):
+        for i, committed_lower in enumerate(self._committed_sources_lower):
             if matched_count >= len(source_sentences):
                 # Source is shorter than committed - this shouldn't happen
-                self._committed_sources = self._committed_sources[:matched_count]
+                self._trim_committed(matched_count)
                 self._retranslate_committed()
                 break
             
             # Fuzzy match
-            similarity = self._similarity(committed_src, source_sentences[matched_count])
+            candidate_lower = source_sentences[matched_count].lower()
+            if (_trigram_dice is not None
+                    and len(committed_lower) >= self.TRIGRAM_MIN_CHARS
+                    and len(candidate_lower) >= self.TRIGRAM_MIN_CHARS):
+                similarity = _trigram_dice(
+                    self._committed_sources_enc[i], _encode_for_match(candidate_lower)
+                )
+            else:
+                similarity = self._similarity(committed_lower, candidate_lower)
             if similarity >= self.FUZZY_THRESHOLD:
                 matched_count += 1
             else:
                 # Mismatch at this position - committed content has diverged
                 # Trim committed to only keep matched ones
-                self._committed_sources = self._committed_sources[:i]
+                self._trim_committed(i)
                 self._retranslate_committed()
                 break
         
         return matched_count
     
+    def _trim_committed(self, count: int) -> None:
+        """Trim committed sources (and their cached mirrors) to count."""
+        prev = len(self._committed_sources)
+        self._committed_sources = self._committed_sources[:count]
+        self._committed_sources_lower = self._committed_sources_lower[:count]
+        self._committed_sources_enc = self._committed_sources_enc[:count]
+        self._committed_norm = " ".join(self._committed_sources_lower)
+
+        # Drop a proportional tail of the translated paragraphs right away.
+        # Paragraph boundaries may drift slightly, but the poll never
+        # blocks on re-translating the whole committed history.
+        if prev > 0 and self._committed_paragraphs:
+            if count == 0:
+                self._committed_paragraphs.clear()
+            else:
+                keep = (len(self._committed_paragraphs) * count + prev - 1) // prev
+                del self._committed_paragraphs[keep:]
+    
     def _retranslate_committed(self) -> None:
-        """Re-translate all committed sources after trimming (rebuild paragraphs)."""
-        if not self._committed_sources or not self.translator:
+        """
+        Rebuild committed paragraphs after a trim.
+
+        The truncated paragraphs from _trim_committed stay on screen
+        immediately; the accurate re-translation runs on the background
+        worker and replaces them silently once it lands (and only if the
+        committed content hasn't changed again in the meantime).
+        """
+        if not self._committed_sources or not (self.translator or self.async_translator):
             self._committed_paragraphs.clear()
             return
-        
-        # When committed is trimmed, we need to rebuild as a single paragraph
-        # (We lose the paragraph structure, but this is a rare edge case)
-        try:
-            text = " ".join(self._committed_sources)
-            translated = self.translator(text) or ""
-            self._committed_paragraphs = [translated] if translated else []
-        except Exception as e:
-            warning(f"TSM: Re-translation error: {e}")
+
+        text = " ".join(self._committed_sources)
+
+        def _job() -> None:
+            try:
+                translated = self._translate_cached(text)
+            except Exception as e:
+                warning(f"TSM: Re-translation error: {e}")
+                return
+            # Apply only if committed content is still what we translated
+            if translated and " ".join(self._committed_sources) == text:
+                self._committed_paragraphs = [translated]
+
+        self._executor.submit(_job)
     
-    def _similarity(self, a: str, b: str) -> float:
-        """Calculate similarity ratio between two strings."""
-        if not a or not b:
+    def _similarity(self, a_lower: str, b_lower: str) -> float:
+        """
+        Similarity ratio between two already-lowercased strings.
+
+        Callers only care whether the result clears FUZZY_THRESHOLD, so
+        cheap upper bounds (length ratio, then difflib's quick ratios)
+        reject non-matches before paying for the full O(n*m) matcher.
+        """
+        if not a_lower or not b_lower:
+            return 0.0
+
+        # ratio() can never exceed 2*min/(len(a)+len(b))
+        if 2.0 * min(len(a_lower), len(b_lower)) / (len(a_lower) + len(b_lower)) < self.FUZZY_THRESHOLD:
+            return 0.0
+
+        # Reuse the shared matcher; only rebuild the b2j index when the
+        # candidate side actually changed
+        sm = self._sm
+        if b_lower != self._sm_seq2:
+            sm.set_seq2(b_lower)
+            self._sm_seq2 = b_lower
+        sm.set_seq1(a_lower)
+
+        if sm.real_quick_ratio() < self.FUZZY_THRESHOLD:
+            return 0.0
+        if sm.quick_ratio() < self.FUZZY_THRESHOLD:
             return 0.0
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+        return sm.ratio()
     
     def _check_commit_threshold(self) -> None:
         """Check if draft should be partially committed."""
@@ -248,35 +642,92 @@ class TranslationStateManager:
             commit_target = self.COMMIT_COUNT
             if total_draft_sources < self.COMMIT_COUNT:
                 commit_target = max(1, total_draft_sources - 1)  # Leave 1 if possible
-            
-            to_commit = self._draft_sources[:commit_target]
+
+            # The translation of the full pre-commit draft, if it already
+            # landed, can often be split instead of re-translated
+            pre_commit_text = " ".join(self._draft_sources)
+
+            to_commit = [self._draft_sources.popleft() for _ in range(commit_target)]
             
             # Add to committed sources
             self._committed_sources.extend(to_commit)
+            self._committed_sources_lower.extend(s.lower() for s in to_commit)
+            if _trigram_dice is not None:
+                self._committed_sources_enc.extend(
+                    _encode_for_match(s.lower()) for s in to_commit
+                )
+            self._committed_norm = " ".join(self._committed_sources_lower)
             
-            # Translate the newly committed batch and add as a NEW PARAGRAPH
-            if self.translator:
+            # Preserve the original trim behavior: the draft advances by
+            # COMMIT_COUNT even when fewer sentences were committed
+            for _ in range(min(len(self._draft_sources),
+                               self.COMMIT_COUNT - commit_target)):
+                self._draft_sources.popleft()
+
+            # Translate the committed batch (new paragraph) and the
+            # remaining draft in a single round-trip where possible
+            if self.translator or self.async_translator:
                 try:
                     batch_text = " ".join(to_commit)
-                    batch_translation = self.translator(batch_text) or ""
+                    draft_text = " ".join(self._draft_sources)
+
+                    # Fast path: the pre-commit draft translation is the
+                    # translation of batch+draft together; when it exists
+                    # and splits cleanly at a sentence boundary, reuse its
+                    # halves and skip the translator entirely
+                    batch_translation = None
+                    pre_translation = self._translation_cache.get(pre_commit_text)
+                    if pre_translation and draft_text:
+                        halves = self._split_translation(
+                            pre_translation, commit_target, total_draft_sources
+                        )
+                        if halves is not None:
+                            batch_translation, self._draft_translation = halves
+                            self._store_translation(batch_text, batch_translation)
+                            self._store_translation(draft_text, self._draft_translation)
+
+                    if batch_translation is None:
+                        batch_translation, self._draft_translation = self._translate_pair(
+                            batch_text, draft_text
+                        )
+                    # Supersede any in-flight background draft translation
+                    self._draft_seq += 1
                     if batch_translation:
                         self._committed_paragraphs.append(batch_translation)
                 except Exception as e:
                     warning(f"TSM: Commit translation error: {e}")
-            
-            # Remove from draft
-            self._draft_sources = self._draft_sources[self.COMMIT_COUNT:]
-            
-            # Re-translate remaining draft
-            if self._draft_sources and self.translator:
-                try:
-                    draft_text = " ".join(self._draft_sources)
-                    self._draft_translation = self.translator(draft_text) or ""
-                except Exception as e:
-                    warning(f"TSM: Draft re-translation error: {e}")
+                    self._draft_translation = ""
             else:
                 self._draft_translation = ""
     
+    def _split_translation(self, translation: str, commit_count: int, total_count: int) -> Optional[Tuple[str, str]]:
+        """
+        Split an existing draft translation at a sentence boundary near the
+        committed/remaining proportion.
+
+        Returns (committed_part, remaining_part), or None when no delimiter
+        falls within 20% of the proportional split point — in which case
+        the caller should translate normally.
+        """
+        if not translation or not 0 < commit_count < total_count:
+            return None
+
+        split = int(len(translation) * commit_count / total_count)
+        window = max(1, int(len(translation) * 0.2))
+        lo = max(0, split - window)
+        hi = min(len(translation), split + window)
+
+        best = None
+        for match in self._sentence_re.finditer(translation, lo, hi):
+            pos = match.end()
+            if best is None or abs(pos - split) < abs(best - split):
+                best = pos
+
+        if best is None:
+            return None
+
+        return translation[:best].strip(), translation[best:].strip()
+
     def _build_state(self) -> TranslationState:
         """Build the current translation state for display."""
         # Join paragraphs with single newline for tighter visual separation
@@ -289,16 +740,32 @@ class TranslationStateManager:
     def reset(self) -> None:
         """Reset all state."""
         self._committed_sources.clear()
+        self._committed_sources_lower.clear()
+        self._committed_sources_enc.clear()
+        self._committed_norm = ""
         self._committed_paragraphs.clear()
         self._draft_sources.clear()
         self._draft_translation = ""
+        self._draft_seq += 1  # Discard any in-flight background translation
         self._last_processed_text = ""
+        self._last_processed_hash = hash("")
+        self._last_draft_tuple = ()
+        self._last_draft_text = ""
+        self._segment_prefix = ""
+        self._segment_prefix_end = 0
+        self._segment_closed = []
     
+    def shutdown(self) -> None:
+        """Stop the background translation worker (and event loop, if any)."""
+        self._executor.shutdown(wait=False)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
     def get_debug_info(self) -> dict:
         """Get debug information about current state."""
         return {
             "committed_sources": self._committed_sources.copy(),
             "committed_paragraphs": self._committed_paragraphs.copy(),
-            "draft_sources": self._draft_sources.copy(),
+            "draft_sources": list(self._draft_sources),
             "draft_translation": self._draft_translation,
         }
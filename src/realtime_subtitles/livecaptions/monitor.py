@@ -3,6 +3,8 @@ Windows LiveCaptions Monitor
 Captures real-time subtitle text using UI Automation
 """
 
+import ctypes
+import sys
 import time
 import threading
 from typing import Optional, Callable
@@ -17,8 +19,69 @@ except ImportError:
 
 from ..logger import info, debug, warning, error
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Windows multimedia timer resolution: default ~15.6ms granularity turns
+# a 100ms sleep into 110-115ms of jitter. Ref-counted so several monitor
+# instances don't stack timeBeginPeriod calls.
+_timer_res_refs = 0
+_timer_res_lock = threading.Lock()
+
+
+def _acquire_timer_resolution() -> None:
+    global _timer_res_refs
+    if sys.platform != "win32":
+        return
+    with _timer_res_lock:
+        if _timer_res_refs == 0:
+            try:
+                ctypes.WinDLL("winmm").timeBeginPeriod(1)
+            except Exception:
+                return
+        _timer_res_refs += 1
+
+
+def _release_timer_resolution() -> None:
+    global _timer_res_refs
+    if sys.platform != "win32":
+        return
+    with _timer_res_lock:
+        if _timer_res_refs > 0:
+            _timer_res_refs -= 1
+            if _timer_res_refs == 0:
+                try:
+                    ctypes.WinDLL("winmm").timeEndPeriod(1)
+                except Exception:
+                    pass
+
+
+def _build_automaton(needles):
+    """Build an Aho-Corasick automaton over needles, or None without the lib."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
 
-@dataclass
+def _contains_any(haystack, automaton, needles) -> bool:
+    """True when any needle occurs in haystack.
+
+    With pyahocorasick installed this is one DFA pass over the haystack
+    regardless of needle count; otherwise it falls back to sequential
+    substring checks."""
+    if automaton is not None:
+        return next(automaton.iter(haystack), None) is not None
+    return any(needle in haystack for needle in needles)
+
+
+@dataclass(slots=True)
 class CaptionEvent:
     """Caption event data"""
     text: str
@@ -59,6 +122,16 @@ class LiveCaptionsMonitor:
         "Sottotitoli Live",     # Italian (it-IT)
         "Живые субтитры",       # Russian (ru-RU)
     ]
+
+    # Initial placeholder texts to ignore (don't set as _last_text)
+    INITIAL_TEXTS = (
+        "即時輔助字幕",
+        "实时辅助字幕",
+        "準備好",
+        "准备好",
+        "Ready for live subtitles",
+        "Live captions",
+    )
     
     def __init__(
         self,
@@ -85,6 +158,17 @@ class LiveCaptionsMonitor:
         self._monitor_thread: Optional[threading.Thread] = None
         self._last_text = ""
         self._caption_element: Optional[auto.Control] = None
+
+        # Event-driven wake-up: when the UIA provider supports property
+        # change events the loop blocks on this instead of busy-polling
+        self._text_event = threading.Event()
+        self._event_driven = False
+        self._last_element_refresh = 0.0
+        self._timer_res_held = False
+
+        # Set once the caption element has been discovered; lets callers
+        # wait for readiness instead of sleeping a fixed interval
+        self._element_found = threading.Event()
         
         info("LiveCaptionsMonitor: Initialized")
     
@@ -102,13 +186,36 @@ class LiveCaptionsMonitor:
             for window in auto.GetRootControl().GetChildren():
                 if window.ClassName == self.WINDOW_CLASS:
                     return window
-                if any(name in window.Name for name in self.WINDOW_NAMES):
+                if _contains_any(window.Name, _WINDOW_NAME_AC, self.WINDOW_NAMES):
                     return window
             return None
             
         except Exception as e:
             return None
     
+    def _try_subscribe(self, element) -> bool:
+        """
+        Subscribe to Name-change events on the caption element.
+
+        Returns True when the provider accepts the handler, in which case
+        the monitor loop waits on the event instead of sleeping a fixed
+        interval. Providers without event support keep the polling path.
+        """
+        add_handler = getattr(element, "AddPropertyChangedEventHandler", None)
+        if not callable(add_handler):
+            return False
+
+        def _on_changed(*args, **kwargs):
+            self._text_event.set()
+
+        try:
+            add_handler(["Name"], _on_changed)
+            debug("LiveCaptionsMonitor: Subscribed to Name change events")
+            return True
+        except Exception as e:
+            debug(f"LiveCaptionsMonitor: Event subscription unavailable: {e}")
+            return False
+
     def _find_caption_element(self, window: auto.WindowControl) -> Optional[auto.Control]:
         """
         Find the caption text element in LiveCaptions window
@@ -130,14 +237,21 @@ class LiveCaptionsMonitor:
             except:
                 pass
             
-            # Search by index as last resort
+            # Last resort: one breadth-first walk of the subtree, filtered
+            # in Python. The old foundIndex scan issued up to three timed
+            # UIA searches (0.3s each); this visits each node once with no
+            # per-candidate wait.
             try:
-                for i in range(1, 4):
-                    text_ctrl = window.TextControl(searchDepth=15, foundIndex=i)
-                    if text_ctrl and text_ctrl.Exists(maxSearchSeconds=0.3):
-                        automation_id = getattr(text_ctrl, 'AutomationId', '') or ""
+                stack = [(window, 0)]
+                while stack:
+                    node, depth = stack.pop()
+                    if depth >= 15:
+                        continue
+                    for child in node.GetChildren():
+                        automation_id = getattr(child, 'AutomationId', '') or ""
                         if automation_id in ["CaptionsTextBlock", "ReadyToCaptionTextBlock"]:
-                            return text_ctrl
+                            return child
+                        stack.append((child, depth + 1))
             except:
                 pass
             
@@ -150,26 +264,49 @@ class LiveCaptionsMonitor:
     def _monitor_loop(self):
         """Main monitoring loop"""
         info("LiveCaptionsMonitor: Monitor loop started")
+
+        # Hot-loop locals: bound once so each 10Hz iteration skips the
+        # module/attribute lookups
+        _time = time.time
+        _sleep = time.sleep
+        _perf = time.perf_counter
+
+        # Placeholders are all short, so texts past this length skip the
+        # scan entirely
+        initial_texts = self.INITIAL_TEXTS
+        max_initial_text_len = 64
+
+        self._last_element_refresh = _time()
+
+        try:
+            self._run_monitor_loop(_time, _sleep, _perf, initial_texts,
+                                   max_initial_text_len)
+        finally:
+            # The loop can terminate itself (max retries); releasing here
+            # guarantees the 1ms timer resolution is returned even when
+            # stop() later short-circuits on _running already being False
+            self._release_timer_resolution_once()
+
+        info("LiveCaptionsMonitor: Monitor loop stopped")
+
+    def _run_monitor_loop(self, _time, _sleep, _perf, initial_texts,
+                          max_initial_text_len):
+        """Body of the monitor loop (see _monitor_loop)."""
         retry_count = 0
         max_retries = 10
-        
-        # Initial placeholder texts to ignore (don't set as _last_text)
-        initial_texts = [
-            "即時輔助字幕",
-            "实时辅助字幕",
-            "準備好",
-            "准备好",
-            "Ready for live subtitles",
-            "Live captions"
-        ]
-        
+
         while self._running:
+            iter_start = _perf()
             try:
                 # Find window and element
                 if not self._caption_element:
+                    self._event_driven = False
                     window = self._find_livecaptions_window()
                     if window:
                         self._caption_element = self._find_caption_element(window)
+                        if self._caption_element:
+                            self._event_driven = self._try_subscribe(self._caption_element)
+                            self._element_found.set()
                         retry_count = 0
                     else:
                         retry_count += 1
@@ -177,19 +314,12 @@ class LiveCaptionsMonitor:
                             error("LiveCaptionsMonitor: Max retries reached, stopping")
                             self._running = False
                             break
-                        time.sleep(1)
+                        _sleep(1)
                         continue
                 
                 # Periodically refresh element to check for CaptionsTextBlock
                 # (CaptionsTextBlock only appears when audio is playing)
-                refresh_needed = False
-                if hasattr(self, '_last_element_refresh'):
-                    if time.time() - self._last_element_refresh > 5:  # Refresh every 5 seconds
-                        refresh_needed = True
-                else:
-                    self._last_element_refresh = time.time()
-                
-                if refresh_needed:
+                if _time() - self._last_element_refresh > 5:  # Refresh every 5 seconds
                     window = self._find_livecaptions_window()
                     if window:
                         new_element = self._find_caption_element(window)
@@ -201,10 +331,12 @@ class LiveCaptionsMonitor:
                             if current_id == "ReadyToCaptionTextBlock" and new_id == "CaptionsTextBlock":
                                 self._caption_element = new_element
                                 self._last_text = ""  # Reset to detect new content
+                                self._event_driven = self._try_subscribe(new_element)
                             elif new_id == "CaptionsTextBlock":
                                 self._caption_element = new_element
+                                self._event_driven = self._try_subscribe(new_element)
                     
-                    self._last_element_refresh = time.time()
+                    self._last_element_refresh = _time()
                 
                 # Read text
                 try:
@@ -235,9 +367,10 @@ class LiveCaptionsMonitor:
                     if current_text is None:
                         current_text = ""  # Treat as empty, not None
                     
-                    # Skip if it's initial placeholder text
-                    if current_text:
-                        is_initial_text = any(initial_text in current_text for initial_text in initial_texts)
+                    # Skip if it's initial placeholder text (placeholders
+                    # are short; long captions skip the substring scan)
+                    if current_text and len(current_text) < max_initial_text_len:
+                        is_initial_text = _contains_any(current_text, _INITIAL_TEXT_AC, initial_texts)
                     else:
                         is_initial_text = False
                     
@@ -248,13 +381,13 @@ class LiveCaptionsMonitor:
                             # Send event
                             event = CaptionEvent(
                                 text=current_text,
-                                timestamp=time.time(),
+                                timestamp=_time(),
                                 is_final=True
                             )
                             self.on_caption(event)
                             self._last_text = current_text
                         elif is_initial_text:
-                            debug(f"LiveCaptionsMonitor: Skipping initial placeholder")
+                            debug("LiveCaptionsMonitor: Skipping initial placeholder")
                             self._last_text = current_text
                         else:
                             # Empty text - just update last_text without sending event
@@ -264,21 +397,42 @@ class LiveCaptionsMonitor:
                     warning(f"LiveCaptionsMonitor: Error reading text: {e}")
                     self._caption_element = None  # Re-find element
                 
-                time.sleep(self.poll_interval)
+                if self._event_driven:
+                    # Block until the provider signals a change (bounded so
+                    # the 5s element refresh still runs)
+                    self._text_event.wait(timeout=1.0)
+                    self._text_event.clear()
+                else:
+                    # Budget the sleep by the work already done this
+                    # iteration so end-to-end cadence stays ~poll_interval
+                    # instead of poll_interval + UIA round-trip time
+                    _sleep(max(0.0, self.poll_interval - (_perf() - iter_start)))
                 
             except Exception as e:
                 error(f"LiveCaptionsMonitor: Monitor loop error: {e}")
-                time.sleep(1)
-        
-        info("LiveCaptionsMonitor: Monitor loop stopped")
-    
+                _sleep(1)
+
+    def _release_timer_resolution_once(self) -> None:
+        """Release the timer resolution exactly once per start()."""
+        if self._timer_res_held:
+            self._timer_res_held = False
+            _release_timer_resolution()
+
+    def wait_until_element_found(self, timeout: float = 2.0) -> bool:
+        """Block until the caption element has been discovered (or timeout)."""
+        return self._element_found.wait(timeout)
+
     def start(self):
         """Start monitoring"""
         if self._running:
             warning("LiveCaptionsMonitor: Already running")
             return
+
+        self._element_found.clear()
         
         self._running = True
+        _acquire_timer_resolution()
+        self._timer_res_held = True
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
         info("LiveCaptionsMonitor: Started")
@@ -289,8 +443,10 @@ class LiveCaptionsMonitor:
             return
         
         self._running = False
+        self._text_event.set()  # Wake the loop if it is blocked on the event
         if self._monitor_thread:
             self._monitor_thread.join(timeout=2)
+        self._release_timer_resolution_once()
         info("LiveCaptionsMonitor: Stopped")
     
     def _default_callback(self, event: CaptionEvent):
@@ -298,6 +454,11 @@ class LiveCaptionsMonitor:
         print(f"[LiveCaptions] {event.text}")
 
 
+# Automatons over the static needle sets, built once at import
+_WINDOW_NAME_AC = _build_automaton(LiveCaptionsMonitor.WINDOW_NAMES)
+_INITIAL_TEXT_AC = _build_automaton(LiveCaptionsMonitor.INITIAL_TEXTS)
+
+
 # Simple test
 if __name__ == "__main__":
     print("Testing LiveCaptionsMonitor...")
@@ -3,8 +3,11 @@ LiveCaptions Pipeline
 Integrates LiveCaptions monitoring, text processing, and translation
 """
 
+import queue
+import re
 import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Callable
 
 from .monitor import LiveCaptionsMonitor, CaptionEvent
@@ -13,13 +16,19 @@ from .manager import TranslationStateManager
 from ..pipeline import SubtitleEvent
 from ..logger import info, debug, warning, error
 
-# Translation support (optional)
-try:
-    from ..translation.translator import create_translator, CTRANSLATE2_AVAILABLE, GOOGLETRANS_AVAILABLE
-    TRANSLATION_AVAILABLE = CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE
-except ImportError:
-    TRANSLATION_AVAILABLE = False
-    create_translator = None
+# Placeholder strings LiveCaptions shows before real captions arrive
+_INITIAL_TEXTS = (
+    "即時輔助字幕",
+    "实时辅助字幕",
+    "Ready for live subtitles",
+    "Live captions",
+    "準備好即時輔助字幕",
+    "准备好实时辅助字幕",
+)
+
+# One compiled alternation: a single C-level scan instead of six Python
+# substring searches per caption tick
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(t) for t in _INITIAL_TEXTS))
 
 
 class LiveCaptionsPipeline:
@@ -46,6 +55,13 @@ class LiveCaptionsPipeline:
         ... )
         >>> pipeline.start()
     """
+
+    # Maximum captions coalesced into one translation batch
+    TRANSLATE_BATCH_MAX = 8
+
+    # LRU size for direct-translation results (LiveCaptions re-emits
+    # growing prefixes of the same utterance)
+    TRANSLATION_CACHE_SIZE = 256
     
     def __init__(
         self,
@@ -54,6 +70,8 @@ class LiveCaptionsPipeline:
         enable_translation: bool = False,
         translation_engine: str = "google",
         target_language: str = "zho_Hant",
+        compute_type: str = "int8",
+        intra_threads: int = 4,
         # LiveCaptions settings
         auto_hide_window: bool = True,
         poll_interval: float = 0.1,
@@ -66,6 +84,8 @@ class LiveCaptionsPipeline:
             enable_translation: Whether to enable translation
             translation_engine: Translation engine ("google", "nllb")
             target_language: Target language code
+            compute_type: CTranslate2 compute type for the nllb engine
+            intra_threads: CTranslate2 threads for the nllb engine
             auto_hide_window: Whether to auto-hide LiveCaptions window
             poll_interval: Monitoring poll interval in seconds
         """
@@ -86,21 +106,47 @@ class LiveCaptionsPipeline:
             poll_interval=poll_interval
         )
         
-        # Translator
+        # Translator. The translation module (and with it CTranslate2's
+        # C++ extension and friends) is only imported when translation is
+        # actually requested — cold imports of this pipeline stay cheap.
         self._translator = None
-        if enable_translation and TRANSLATION_AVAILABLE:
+        if enable_translation:
             try:
-                self._translator = create_translator(
-                    engine=translation_engine,
-                    target_language=target_language,
+                from ..translation.translator import (
+                    create_translator,
+                    CTRANSLATE2_AVAILABLE,
+                    GOOGLETRANS_AVAILABLE,
                 )
-                info(f"LiveCaptionsPipeline: Translator initialized ({translation_engine})")
+                if CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE:
+                    extra_kwargs = {}
+                    if translation_engine == "nllb":
+                        extra_kwargs = {
+                            "compute_type": compute_type,
+                            "intra_threads": intra_threads,
+                        }
+                    self._translator = create_translator(
+                        engine=translation_engine,
+                        target_language=target_language,
+                        **extra_kwargs,
+                    )
+                    info(f"LiveCaptionsPipeline: Translator initialized ({translation_engine})")
+            except ImportError:
+                warning("LiveCaptionsPipeline: Translation support not available")
             except Exception as e:
                 warning(f"LiveCaptionsPipeline: Translation init failed: {e}")
         
         # State
         self._running = False
         self._last_sent_text = ""
+
+        # Caption hand-off to the translation worker (see _translate_loop).
+        # Bounded: a stalled translator drops the oldest pending caption
+        # instead of stalling the monitor or growing without limit.
+        self._caption_queue: queue.Queue = queue.Queue(maxsize=32)
+        self._translate_worker: Optional[threading.Thread] = None
+
+        # Direct-translation LRU (the state manager keeps its own cache)
+        self._translation_cache: OrderedDict = OrderedDict()
         
         # Translation state manager for incremental translation
         self._translation_manager = None
@@ -114,65 +160,134 @@ class LiveCaptionsPipeline:
         info(f"LiveCaptionsPipeline: Initialized, translation={trans_status}")
     
     def _on_caption(self, caption: CaptionEvent):
-        """Process caption events"""
+        """Process caption events: filter, dedup, and hand to the worker"""
         try:
             # Filter out initial placeholder text from LiveCaptions
-            initial_texts = [
-                "即時輔助字幕",
-                "实时辅助字幕", 
-                "Ready for live subtitles",
-                "Live captions",
-                "準備好即時輔助字幕",
-                "准备好实时辅助字幕"
-            ]
-            
-            if any(initial_text in caption.text for initial_text in initial_texts):
-                debug(f"LiveCaptionsPipeline: Skipping initial placeholder text: {caption.text}")
+            if _PLACEHOLDER_RE.search(caption.text):
+                debug("LiveCaptionsPipeline: Skipping initial placeholder text: %s", caption.text)
                 return
             
-            # Deduplication: avoid sending duplicate content
+            # Deduplication: avoid sending duplicate content (checked before
+            # enqueue so duplicates never reach the batcher)
             if caption.text == self._last_sent_text:
                 debug("LiveCaptionsPipeline: Duplicate text, skipping")
                 return
-            
-            # Use translation manager for incremental translation
+            self._last_sent_text = caption.text
+
+            if self._translation_manager or self._translator:
+                try:
+                    self._caption_queue.put_nowait(caption)
+                except queue.Full:
+                    # Drop the oldest pending caption; the newest snapshot
+                    # is the one worth translating
+                    try:
+                        self._caption_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    try:
+                        self._caption_queue.put_nowait(caption)
+                    except queue.Full:
+                        pass
+            else:
+                self._emit_event(caption, None, None, None)
+
+        except Exception as e:
+            error(f"LiveCaptionsPipeline: Error processing caption: {e}")
+
+    def _translate_loop(self):
+        """Worker: drain queued captions and translate them in batches."""
+        while True:
+            caption = self._caption_queue.get()
+            if caption is None:
+                break
+
+            batch = [caption]
+            while len(batch) < self.TRANSLATE_BATCH_MAX:
+                try:
+                    next_caption = self._caption_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if next_caption is None:
+                    return
+                batch.append(next_caption)
+
+            try:
+                self._process_caption_batch(batch)
+            except Exception as e:
+                error(f"LiveCaptionsPipeline: Error processing caption: {e}")
+
+    def _process_caption_batch(self, batch):
+        """Translate a batch of captions and emit subtitle events."""
+        if self._translation_manager:
+            # The stream is a growing prefix of the same utterance, so only
+            # the newest snapshot matters; the manager supersedes older ones
+            caption = batch[-1]
             committed_translation = None
             draft_translation = None
-            translated_text = None
-            
-            if self._translation_manager:
-                try:
-                    state = self._translation_manager.process_text(caption.text)
-                    committed_translation = state.committed_text
-                    draft_translation = state.draft_text
-                except Exception as e:
-                    warning(f"LiveCaptionsPipeline: Translation manager failed: {e}")
-            elif self._translator:
-                # Fallback: direct translation without state management
+            try:
+                state = self._translation_manager.process_text(caption.text)
+                committed_translation = state.committed_text
+                draft_translation = state.draft_text
+            except Exception as e:
+                warning(f"LiveCaptionsPipeline: Translation manager failed: {e}")
+            self._emit_event(caption, None, committed_translation, draft_translation)
+            return
+
+        # Fallback: direct translation without state management. Cache hits
+        # skip the translator; the remaining misses go through one batched
+        # model call when the translator supports it (CTranslate2 runs the
+        # whole batch through the same padded matmuls).
+        texts = [c.text for c in batch]
+        results = []
+        misses = []
+        for index, text in enumerate(texts):
+            cached = self._translation_cache.get(text)
+            if cached is not None:
+                self._translation_cache.move_to_end(text)
+            else:
+                misses.append(index)
+            results.append(cached)
+
+        translate_batch = getattr(self._translator, "translate_batch", None)
+        if callable(translate_batch) and len(misses) > 1:
+            try:
+                translated = translate_batch([texts[i] for i in misses])
+            except Exception as e:
+                warning(f"LiveCaptionsPipeline: Translation failed: {e}")
+                translated = [None] * len(misses)
+            for index, result in zip(misses, translated):
+                results[index] = result
+        else:
+            for index in misses:
                 try:
-                    translated_text = self._translator.translate(caption.text)
+                    results[index] = self._translator.translate(texts[index])
                 except Exception as e:
                     warning(f"LiveCaptionsPipeline: Translation failed: {e}")
-            
-            # Create subtitle event with dual-buffer translation fields
-            event = SubtitleEvent(
-                text=caption.text,
-                language="auto",  # LiveCaptions auto-detects language
-                confidence=1.0,
-                timestamp=caption.timestamp,
-                is_partial=not caption.is_final,
-                translated_text=translated_text,
-                target_language=self._translator.target_language if self._translator else None,
-                committed_translation=committed_translation,
-                draft_translation=draft_translation
-            )
-            
-            # Send
-            self.on_subtitle(event)
-            self._last_sent_text = caption.text
-            
-        except Exception as e:
-            error(f"LiveCaptionsPipeline: Error processing caption: {e}")
+
+        for index in misses:
+            if results[index]:
+                self._translation_cache[texts[index]] = results[index]
+                if len(self._translation_cache) > self.TRANSLATION_CACHE_SIZE:
+                    self._translation_cache.popitem(last=False)
+
+        for caption, translated_text in zip(batch, results):
+            self._emit_event(caption, translated_text, None, None)
+
+    def _emit_event(self, caption: CaptionEvent, translated_text, committed_translation, draft_translation):
+        """Build and send a subtitle event for a caption."""
+        # Create subtitle event with dual-buffer translation fields
+        event = SubtitleEvent(
+            text=caption.text,
+            language="auto",  # LiveCaptions auto-detects language
+            confidence=1.0,
+            timestamp=caption.timestamp,
+            is_partial=not caption.is_final,
+            translated_text=translated_text,
+            target_language=self._translator.target_language if self._translator else None,
+            committed_translation=committed_translation,
+            draft_translation=draft_translation
+        )
+        self.on_subtitle(event)
     
     def start(self):
         """Start the pipeline"""
@@ -186,19 +301,33 @@ class LiveCaptionsPipeline:
             info("LiveCaptionsPipeline: Launching LiveCaptions...")
             if not LiveCaptionsController.launch_livecaptions():
                 raise RuntimeError("Failed to launch LiveCaptions")
-            
-            # Wait for window to appear
-            time.sleep(2)
+
+            # launch_livecaptions already polls for the window; this only
+            # covers the case where it gave up early
+            if not self._wait_for_ready():
+                warning("LiveCaptionsPipeline: Window not confirmed, continuing anyway")
         else:
             info("LiveCaptionsPipeline: LiveCaptions already running")
         
-        # Start monitor
+        # Start the translation worker, then the monitor
+        self._translate_worker = threading.Thread(target=self._translate_loop, daemon=True)
+        self._translate_worker.start()
         self._monitor.start()
         self._running = True
-        
-        # Hide window AFTER monitor has found the element
-        # Wait a bit for monitor to initialize
-        time.sleep(1)
+
+        # Pre-warm the translator while the monitor settles below, so the
+        # first real caption doesn't pay workspace allocation and first-
+        # forward fusion inside the model
+        if self._translator:
+            try:
+                self._translator.translate("hello")
+            except Exception as e:
+                debug(f"LiveCaptionsPipeline: Translator warm-up failed: {e}")
+
+        # Hide window AFTER monitor has found the element: wait on the
+        # monitor's discovery event instead of a fixed sleep
+        if not self._monitor.wait_until_element_found(timeout=2.0):
+            debug("LiveCaptionsPipeline: Caption element not found yet, continuing")
         
         if self.auto_hide_window:
             info("LiveCaptionsPipeline: Minimizing LiveCaptions window...")
@@ -213,6 +342,16 @@ class LiveCaptionsPipeline:
         
         info("LiveCaptionsPipeline: Started")
     
+    @staticmethod
+    def _wait_for_ready(timeout: float = 3.0, interval: float = 0.05) -> bool:
+        """Poll until the LiveCaptions window exists, or the timeout passes."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if LiveCaptionsController.is_livecaptions_running():
+                return True
+            time.sleep(interval)
+        return False
+
     def stop(self):
         """Stop the pipeline"""
         if not self._running:
@@ -220,6 +359,17 @@ class LiveCaptionsPipeline:
         
         self._monitor.stop()
         self._running = False
+
+        # Unblock and retire the translation worker
+        self._caption_queue.put(None)
+        if self._translate_worker:
+            self._translate_worker.join(timeout=2)
+            self._translate_worker = None
+
+        # Retire the state manager's background workers too, or each
+        # start/stop cycle leaks its translate thread (and event loop)
+        if self._translation_manager:
+            self._translation_manager.shutdown()
         
         info("LiveCaptionsPipeline: Stopped")
     
@@ -242,15 +392,18 @@ if __name__ == "__main__":
         auto_hide_window=False  # Don't hide window for observation
     )
     
+    import signal
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
     try:
         pipeline.start()
-        
-        # Run for a while
+
         print("\nListening for captions...")
-        while True:
-            time.sleep(0.1)
-            
-    except KeyboardInterrupt:
+        # Timed wait keeps Ctrl+C responsive on Windows at 1 wakeup/s
+        while not stop_event.wait(timeout=1.0):
+            pass
         print("\n\nStopping...")
     finally:
         pipeline.stop()
@@ -4,14 +4,19 @@ Logging utility for ARIA.
 Provides file and console logging with session-based detailed/simple logs.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from .timezone_utils import now_in_app_timezone, datetime_from_timestamp
 
 
 # Global logger instance
 _logger = None
+_queue_listener = None
+_console_handler = None
 _console_mode = "verbose"  # verbose | simple
 _simple_logger = None
 _simple_file_handler = None
@@ -19,68 +24,85 @@ _simple_log_mode = "session"
 
 
 class _InstantAppendFileHandler(logging.Handler):
-    """Append one log line at a time and flush immediately."""
+    """Append one log line at a time through a persistent file object."""
 
     def __init__(self, file_path: Path, level: int = logging.NOTSET):
         super().__init__(level)
         self.file_path = Path(file_path)
-
-    # Disable logging's default thread lock behavior for this handler.
-    def createLock(self):
-        self.lock = None
-
-    def acquire(self):
-        return
-
-    def release(self):
-        return
+        # Line-buffered: every record still lands on disk per line, but
+        # without the open/close syscall pair the old per-record reopen paid
+        self._fp = open(self.file_path, "a", encoding="utf-8", buffering=1)
+        atexit.register(self.close)
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            with open(self.file_path, "a", encoding="utf-8") as f:
-                f.write(msg + "\n")
-                f.flush()
+            self._fp.write(self.format(record) + "\n")
         except Exception:
             self.handleError(record)
 
+    def close(self) -> None:
+        try:
+            if not self._fp.closed:
+                self._fp.close()
+        except Exception:
+            pass
+        super().close()
+
 
 class _ConsoleModeFilter(logging.Filter):
     """Filter console logs based on selected console mode."""
 
     def filter(self, record: logging.LogRecord) -> bool:
-        if _console_mode == "verbose":
-            return True
-        return bool(getattr(record, "is_transcript", False))
+        # Most records don't carry is_transcript at all, so probe the
+        # record's __dict__ directly instead of paying getattr's
+        # attribute-protocol walk per record
+        return _console_mode == "verbose" or bool(
+            record.__dict__.get("is_transcript", False)
+        )
 
 
-class _ConsoleModeFormatter(logging.Formatter):
-    """Switch console format based on current console mode."""
+class _TimezoneFormatter(logging.Formatter):
+    """
+    Formatter that renders timestamps in the app timezone.
 
-    def format(self, record: logging.LogRecord) -> str:
-        if _console_mode == "simple":
-            self._style._fmt = "%(asctime)s %(message)s"
-            self.datefmt = "%Y-%m-%d %H:%M:%S"
-        else:
-            self._style._fmt = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-            self.datefmt = "%Y-%m-%d %H:%M:%S"
-        return super().format(record)
+    Both output formats have one-second resolution, so records landing in
+    the same second share a cached string instead of each constructing a
+    timezone-aware datetime.
+    """
+
+    _time_cache_key = None
+    _time_cache_value = ""
 
     def formatTime(self, record, datefmt=None):
+        key = (int(record.created), datefmt)
+        if key == _TimezoneFormatter._time_cache_key:
+            return _TimezoneFormatter._time_cache_value
+
         dt = datetime_from_timestamp(record.created)
         if datefmt:
-            return dt.strftime(datefmt)
-        return dt.isoformat(sep=" ", timespec="seconds")
+            value = dt.strftime(datefmt)
+        else:
+            value = dt.isoformat(sep=" ", timespec="seconds")
+
+        _TimezoneFormatter._time_cache_key = key
+        _TimezoneFormatter._time_cache_value = value
+        return value
 
 
-class _SimpleFormatter(logging.Formatter):
+class _SimpleFormatter(_TimezoneFormatter):
     """Timezone-aware formatter for transcript/simple logs."""
 
-    def formatTime(self, record, datefmt=None):
-        dt = datetime_from_timestamp(record.created)
-        if datefmt:
-            return dt.strftime(datefmt)
-        return dt.isoformat(sep=" ", timespec="seconds")
+
+# Static formatters: console mode switches swap these on the handler
+# instead of mutating a shared formatter's private state on every record
+_verbose_formatter = _TimezoneFormatter(
+    fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+_simple_console_formatter = _TimezoneFormatter(
+    fmt="%(asctime)s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 def get_log_dir() -> Path:
@@ -104,8 +126,8 @@ def setup_logger(name: str = "ARIA", level: int = logging.DEBUG) -> logging.Logg
     Returns:
         Configured logger instance
     """
-    global _logger
-    
+    global _logger, _queue_listener, _console_handler
+
     if _logger is not None:
         return _logger
     
@@ -116,19 +138,15 @@ def setup_logger(name: str = "ARIA", level: int = logging.DEBUG) -> logging.Logg
     if _logger.handlers:
         return _logger
 
-    # Log format
-    formatter = _ConsoleModeFormatter(
-        fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
     # Console handler (INFO and above)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(
+        _simple_console_formatter if _console_mode == "simple" else _verbose_formatter
+    )
     console_handler.addFilter(_ConsoleModeFilter())
-    _logger.addHandler(console_handler)
-    
+    _console_handler = console_handler
+
     # Detailed file handler (new file per app run)
     log_dir = get_log_dir()
     ts = now_in_app_timezone().strftime("%Y%m%d_%H%M%S")
@@ -136,11 +154,23 @@ def setup_logger(name: str = "ARIA", level: int = logging.DEBUG) -> logging.Logg
 
     file_handler = _InstantAppendFileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    _logger.addHandler(file_handler)
-    
+    file_handler.setFormatter(_verbose_formatter)
+
+    # Route records through a queue so formatting and console/file I/O
+    # happen on a background thread; callers (including the audio capture
+    # path) only pay for an enqueue, never a blocking write
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    # Drain queued records before the file handler's own atexit close runs
+    # (atexit is LIFO; the handler registered its close first)
+    atexit.register(_queue_listener.stop)
+
     _logger.info(f"Logger initialized. Log file: {log_file}")
-    
+
     return _logger
 
 
@@ -162,6 +192,10 @@ def set_console_mode(mode: str) -> None:
     if mode not in ("verbose", "simple"):
         return
     _console_mode = mode
+    if _console_handler is not None:
+        _console_handler.setFormatter(
+            _simple_console_formatter if mode == "simple" else _verbose_formatter
+        )
 
 
 def get_console_mode() -> str:
@@ -214,30 +248,34 @@ def _build_simple_handler(path: Path) -> _InstantAppendFileHandler:
     return handler
 
 
-# Convenience functions
+# Convenience functions. These read the module global directly instead of
+# going through get_logger(): one function call less per log line, which
+# matters for the 10Hz polling paths. (The names are imported with
+# `from ..logger import debug`, so the functions themselves must stay —
+# rebinding them after setup would not reach existing import sites.)
 def debug(msg: str, *args, **kwargs):
     """Log debug message."""
-    get_logger().debug(msg, *args, **kwargs)
+    (_logger or setup_logger()).debug(msg, *args, **kwargs)
 
 
 def info(msg: str, *args, **kwargs):
     """Log info message."""
-    get_logger().info(msg, *args, **kwargs)
+    (_logger or setup_logger()).info(msg, *args, **kwargs)
 
 
 def warning(msg: str, *args, **kwargs):
     """Log warning message."""
-    get_logger().warning(msg, *args, **kwargs)
+    (_logger or setup_logger()).warning(msg, *args, **kwargs)
 
 
 def error(msg: str, *args, **kwargs):
     """Log error message."""
-    get_logger().error(msg, *args, **kwargs)
+    (_logger or setup_logger()).error(msg, *args, **kwargs)
 
 
 def exception(msg: str, *args, **kwargs):
     """Log exception with traceback."""
-    get_logger().exception(msg, *args, **kwargs)
+    (_logger or setup_logger()).exception(msg, *args, **kwargs)
 
 
 def transcript(msg: str):
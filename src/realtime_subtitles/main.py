@@ -5,8 +5,9 @@ Run with: python -m realtime_subtitles.main
 """
 
 import sys
-import time
 import argparse
+import signal
+import threading
 from typing import Optional
 
 from .pipeline import RealtimePipeline, SubtitleEvent
@@ -85,11 +86,16 @@ def main():
         on_subtitle=on_subtitle,
     )
     
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
     try:
         pipeline.start()
-        while True:
-            time.sleep(0.1)
-    except KeyboardInterrupt:
+        # Park until Ctrl+C sets the event. The timed wait (1 wakeup/s vs
+        # the old 10Hz poll) keeps the main thread signal-responsive on
+        # Windows, where an untimed lock wait would block Ctrl+C delivery.
+        while not stop_event.wait(timeout=1.0):
+            pass
         print("\n\nStopping...")
     finally:
         pipeline.stop()
@@ -8,6 +8,8 @@ a seamless real-time subtitle generation system.
 import threading
 import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from typing import Optional, Callable
 from dataclasses import dataclass
 import numpy as np
@@ -17,21 +19,13 @@ from .audio.buffer import StreamingAudioBuffer, SimpleAudioBuffer
 from .transcription.whisper_transcriber import WhisperTranscriber, TranscriptionResult
 from .logger import info, debug, warning, error, transcript, get_console_mode
 
-# Translation support (optional)
-try:
-    from .translation.translator import create_translator, CTRANSLATE2_AVAILABLE, GOOGLETRANS_AVAILABLE
-    TRANSLATION_AVAILABLE = CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE
-except ImportError:
-    TRANSLATION_AVAILABLE = False
-    create_translator = None
-
 try:
     from opencc import OpenCC
 except Exception:
     OpenCC = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEvent:
     """A subtitle event with text and metadata."""
     text: str
@@ -83,6 +77,7 @@ class RealtimePipeline:
         target_language: str = "zh",
         audio_source: str = "system",
         chinese_script: Optional[str] = None,
+        batch_short_segments: bool = False,
     ):
         """
         Initialize the pipeline.
@@ -98,6 +93,10 @@ class RealtimePipeline:
             enable_translation: Whether to enable translation
             translation_engine: "google" or "nllb"
             target_language: Target language for translation
+            batch_short_segments: Concatenate queued short segments into a
+                                 single Whisper pass (amortizes fixed
+                                 per-call model overhead, at the cost of
+                                 merging VAD segment boundaries)
         """
         self.on_subtitle = on_subtitle or self._default_callback
         self.use_vad = use_vad
@@ -105,6 +104,7 @@ class RealtimePipeline:
         self.translation_engine = translation_engine
         self.target_language = target_language
         self.chinese_script = chinese_script
+        self._batch_short_segments = batch_short_segments
         self._script_converter = None
         
         # Components
@@ -128,14 +128,23 @@ class RealtimePipeline:
                     warning(f"Pipeline: Failed to init OpenCC: {e}")
                     self._script_converter = None
         
-        # Translation (optional)
+        # Translation (optional; the module and its heavyweight backends
+        # are only imported when translation is requested)
         self._translator = None
-        if enable_translation and TRANSLATION_AVAILABLE:
+        if enable_translation:
             try:
-                self._translator = create_translator(
-                    engine=translation_engine,
-                    target_language=target_language,
+                from .translation.translator import (
+                    create_translator,
+                    CTRANSLATE2_AVAILABLE,
+                    GOOGLETRANS_AVAILABLE,
                 )
+                if CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE:
+                    self._translator = create_translator(
+                        engine=translation_engine,
+                        target_language=target_language,
+                    )
+            except ImportError:
+                warning("Pipeline: Translation support not available")
             except Exception as e:
                 warning(f"Pipeline: Translation init failed: {e}")
                 self._translator = None
@@ -157,11 +166,36 @@ class RealtimePipeline:
         
         # State
         self._running = False
-        # Use a limited queue to prevent unbounded latency
-        # If transcription can't keep up, old segments will be dropped
-        self._transcription_queue: queue.Queue = queue.Queue(maxsize=3)
+        # Bounded SPSC hand-off to the transcription thread: deque
+        # append/popleft are atomic under the GIL, so the audio-side
+        # producer never takes a lock, and maxlen drops the oldest span
+        # when transcription can't keep up.
+        self._segments: deque = deque(maxlen=3)
+        self._segment_ready = threading.Event()
         self._transcription_thread: Optional[threading.Thread] = None
         self._dropped_segments = 0  # Track how many segments were dropped
+
+        # Segment hand-off ring: segments are written once into this
+        # preallocated buffer and the queue carries (start, length) spans
+        # instead of freshly allocated arrays. Sized to 60s — double the
+        # worst case of 3 queued 10s segments — so in-flight spans are
+        # never overwritten before transcription reads them.
+        self._segment_ring = np.empty(16000 * 60, dtype=np.float32)
+        self._segment_write = 0
+
+        # Translation overlap: the transcription loop submits translation
+        # and moves straight on to the next segment; the emit thread pairs
+        # each result with its finished translation, in order
+        self._translate_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pipeline-translate"
+        )
+        self._emit_queue: queue.Queue = queue.Queue()
+        self._emit_thread: Optional[threading.Thread] = None
+
+        # Memoized translations: Whisper re-emits identical tails during
+        # partial updates, and the translator is pure in its input
+        self._translate_cache: dict = {}
+        self._translate_order: deque = deque(maxlen=64)
         
         # Display state (like realtime mode)
         self.max_lines = 3  # Maximum lines to display
@@ -178,46 +212,35 @@ class RealtimePipeline:
         Args:
             text: Text to split
             max_chars_per_line: Maximum characters per line
-            
+
         Returns:
             List of lines
         """
-        if len(text) <= max_chars_per_line:
+        n = len(text)
+        if n <= max_chars_per_line:
             return [text]
-        
+
+        # Single index-based scan: no split() list, no per-word string
+        # concatenation — each line is one slice and the break point comes
+        # from C-level rfind
         lines = []
-        current_line = ""
-        
-        # Split by spaces for English, or character by character for CJK
-        words = text.split(' ')
-        
-        for word in words:
-            # Check if adding this word would exceed the limit
-            test_line = current_line + (' ' if current_line else '') + word
-            
-            if len(test_line) <= max_chars_per_line:
-                current_line = test_line
+        i = 0
+        while i < n:
+            j = i + max_chars_per_line
+            if j >= n:
+                lines.append(text[i:])
+                break
+
+            # Break at the last space that keeps the line within the limit
+            k = text.rfind(' ', i, j + 1)
+            if k > i:
+                lines.append(text[i:k])
+                i = k + 1
             else:
-                # Current line is full
-                if current_line:
-                    lines.append(current_line)
-                
-                # Handle very long words (like CJK text without spaces)
-                if len(word) > max_chars_per_line:
-                    # Split long word into chunks
-                    for i in range(0, len(word), max_chars_per_line):
-                        chunk = word[i:i + max_chars_per_line]
-                        if i + max_chars_per_line < len(word):
-                            lines.append(chunk)
-                        else:
-                            current_line = chunk
-                else:
-                    current_line = word
-        
-        # Don't forget the last line
-        if current_line:
-            lines.append(current_line)
-        
+                # No space in the window (CJK or one very long word)
+                lines.append(text[i:j])
+                i = j
+
         return lines
     
     def _default_callback(self, event: SubtitleEvent) -> None:
@@ -229,21 +252,43 @@ class RealtimePipeline:
         self._buffer.add_audio(audio)
     
     def _on_audio_segment(self, audio: np.ndarray) -> None:
-        """Callback from Buffer - queues for transcription."""
+        """Callback from Buffer - stashes audio in the ring and queues its span."""
         debug(f"Pipeline: Audio segment received ({len(audio)/16000:.1f}s)")
-        try:
-            # Try to add to queue, but don't block if full
-            self._transcription_queue.put_nowait(audio)
-        except queue.Full:
-            # Queue is full - drop the oldest segment and add new one
-            try:
-                self._transcription_queue.get_nowait()  # Remove oldest
-                self._transcription_queue.put_nowait(audio)  # Add newest
-                self._dropped_segments += 1
-                if self._dropped_segments % 5 == 1:  # Log every 5 drops
-                    warning(f"Pipeline: Dropped {self._dropped_segments} segments (transcription can't keep up)")
-            except queue.Empty:
-                pass
+
+        n = len(audio)
+        if n > len(self._segment_ring):
+            audio = audio[-len(self._segment_ring):]
+            n = len(audio)
+        if self._segment_write + n > len(self._segment_ring):
+            # Wrap whole segments; spans never straddle the ring edge
+            self._segment_write = 0
+        start = self._segment_write
+        self._segment_ring[start:start + n] = audio
+        self._segment_write = start + n
+        span = (start, n)
+
+        if len(self._segments) == self._segments.maxlen:
+            # Deque maxlen evicts the oldest span on append
+            self._dropped_segments += 1
+            if self._dropped_segments % 5 == 1:  # Log every 5 drops
+                warning(f"Pipeline: Dropped {self._dropped_segments} segments (transcription can't keep up)")
+        self._segments.append(span)
+        self._segment_ready.set()
+
+    def _translate_cached(self, text: str) -> str:
+        """Translate with a small memo; repeated text skips the round-trip."""
+        cached = self._translate_cache.get(text)
+        if cached is not None:
+            return cached
+
+        translated = self._translator.translate(text)
+        if translated:
+            if len(self._translate_order) == self._translate_order.maxlen:
+                oldest = self._translate_order[0]
+                self._translate_cache.pop(oldest, None)
+            self._translate_order.append(text)
+            self._translate_cache[text] = translated
+        return translated
 
     def _normalize_chinese_script(self, text: str) -> str:
         if not text:
@@ -258,67 +303,120 @@ class RealtimePipeline:
     def _transcription_loop(self) -> None:
         """Background thread for transcription."""
         while self._running:
-            try:
-                audio = self._transcription_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            
-            # Check if we're falling behind and skip if too many queued
-            queue_size = self._transcription_queue.qsize()
-            if queue_size >= 2:
-                warning(f"Pipeline: Queue backup ({queue_size} segments), skipping older audio")
-                continue  # Skip this segment to catch up
-            
-            # Skip if too short
-            duration = len(audio) / 16000
-            if duration < 0.3:
-                continue
-            
-            # Transcribe
-            try:
-                result = self._transcriber.transcribe(audio)
+            # Untimed wait: zero wakeups while idle. stop() sets the event
+            # after clearing _running, so shutdown still wakes us.
+            self._segment_ready.wait()
+            self._segment_ready.clear()
+
+            while self._running:
+                try:
+                    start, length = self._segments.popleft()
+                except IndexError:
+                    break
+
+                # View into the hand-off ring; transcription reads it before
+                # the writer can lap
+                audio = self._segment_ring[start:start + length]
+
+                if self._batch_short_segments:
+                    # Coalesce queued short segments into one forward pass
+                    # while staying inside Whisper's 30s context
+                    pieces = [audio]
+                    total = length
+                    while len(pieces) < 4:
+                        try:
+                            next_start, next_length = self._segments.popleft()
+                        except IndexError:
+                            break
+                        if total + next_length < 25 * 16000:
+                            pieces.append(
+                                self._segment_ring[next_start:next_start + next_length]
+                            )
+                            total += next_length
+                        else:
+                            self._segments.appendleft((next_start, next_length))
+                            break
+                    if len(pieces) > 1:
+                        audio = np.concatenate(pieces)
+                else:
+                    # Check if we're falling behind and skip if too many queued
+                    backlog = len(self._segments)
+                    if backlog >= 2:
+                        warning(f"Pipeline: Queue backup ({backlog} segments), skipping older audio")
+                        continue  # Skip this segment to catch up
+
+                # Skip if too short
+                duration = len(audio) / 16000
+                if duration < 0.3:
+                    continue
+
+                # Transcribe
+                try:
+                    result = self._transcriber.transcribe(audio)
                 
-                if result.text.strip():
-                    text = self._normalize_chinese_script(result.text.strip())
-                    
-                    # Split text into lines, keep only last max_lines
-                    lines = self._split_into_lines(text, max_chars_per_line=45)
-                    display_lines = lines[-self.max_lines:]  # Only show last 5 lines
-                    display_text = "\n".join(display_lines)
-
-                    # Always write original transcript to simple session log.
-                    transcript(text)
-                    # Verbose console keeps detailed transcript line.
-                    if get_console_mode() != "simple":
-                        info(f"Pipeline: Transcript: {text}")
+                    if result.text.strip():
+                        text = self._normalize_chinese_script(result.text.strip())
                     
-                    # Translate if enabled
-                    translated_display = None
-                    if self._translator:
-                        try:
-                            translated = self._translator.translate(text)
-                            if translated:
-                                # Split translation into lines too, keep only last max_lines
-                                trans_lines = self._split_into_lines(translated, max_chars_per_line=45)
-                                trans_display_lines = trans_lines[-self.max_lines:]
-                                translated_display = "\n".join(trans_display_lines)
-                                debug(f"Pipeline: Translated: {text} -> {translated}")
-                                # Always write translation to simple session log.
-                                transcript(translated)
-                        except Exception as e:
-                            warning(f"Pipeline: Translation error: {e}")
+                        # Split text into lines, keep only last max_lines
+                        lines = self._split_into_lines(text, max_chars_per_line=45)
+                        display_lines = lines[-self.max_lines:]  # Only show last 5 lines
+                        display_text = "\n".join(display_lines)
+
+                        # Always write original transcript to simple session log.
+                        transcript(text)
+                        # Verbose console keeps detailed transcript line.
+                        if get_console_mode() != "simple":
+                            info(f"Pipeline: Transcript: {text}")
                     
-                    event = SubtitleEvent(
-                        text=display_text,
-                        language=result.language,
-                        confidence=result.confidence,
-                        timestamp=time.time(),
-                        translated_text=translated_display,
-                        target_language=self.target_language if translated_display else None,
-                    )
-                    self.on_subtitle(event)
+                        # Hand translation to the background pool so segment
+                        # N+1 transcribes while segment N translates
+                        future = None
+                        if self._translator:
+                            future = self._translate_pool.submit(
+                                self._translate_cached, text
+                            )
+
+                        self._emit_queue.put((result, display_text, future))
+                except Exception as e:
+                    error(f"Pipeline: Transcription error: {e}")
+
+    def _emit_loop(self) -> None:
+        """Pair results with finished translations and emit events in order."""
+        while True:
+            item = self._emit_queue.get()
+            if item is None:
+                break
+
+            result, display_text, future = item
+
+            translated_display = None
+            if future is not None:
+                try:
+                    translated = future.result()
+                    if translated:
+                        # Split translation into lines too, keep only last max_lines
+                        trans_lines = self._split_into_lines(translated, max_chars_per_line=45)
+                        trans_display_lines = trans_lines[-self.max_lines:]
+                        translated_display = "\n".join(trans_display_lines)
+                        debug(f"Pipeline: Translated: {translated}")
+                        # Always write translation to simple session log.
+                        transcript(translated)
+                except Exception as e:
+                    warning(f"Pipeline: Translation error: {e}")
+
+            event = SubtitleEvent(
+                text=display_text,
+                language=result.language,
+                confidence=result.confidence,
+                timestamp=time.time(),
+                translated_text=translated_display,
+                target_language=self.target_language if translated_display else None,
+            )
+            try:
+                self.on_subtitle(event)
             except Exception as e:
-                error(f"Pipeline: Transcription error: {e}")
+                # A raising subscriber must not kill the emit thread
+                error(f"Pipeline: Subtitle callback error: {e}")
     
     def start(self) -> None:
         """Start the real-time pipeline."""
@@ -344,12 +442,15 @@ class RealtimePipeline:
         
         self._running = True
         
-        # Start transcription thread
+        # Start transcription and emit threads
         self._transcription_thread = threading.Thread(
             target=self._transcription_loop,
             daemon=True,
         )
         self._transcription_thread.start()
+
+        self._emit_thread = threading.Thread(target=self._emit_loop, daemon=True)
+        self._emit_thread.start()
         
         # Start audio capture AFTER models are loaded
         self._audio_capture.start(callback=self._on_audio)
@@ -362,17 +463,25 @@ class RealtimePipeline:
         
         self._audio_capture.stop()
         self._buffer.reset()
-        
+
+        # Drop pending spans and wake the parked transcription loop BEFORE
+        # joining, so the untimed wait returns immediately and the thread
+        # is gone before the models below are released out from under it
+        self._segments.clear()
+        self._segment_ready.set()
+
         if self._transcription_thread:
             self._transcription_thread.join(timeout=2.0)
-        
-        # Clear queue
-        while not self._transcription_queue.empty():
-            try:
-                self._transcription_queue.get_nowait()
-            except queue.Empty:
-                break
-        
+
+        # Retire the emit thread after the transcription loop stops feeding it
+        self._emit_queue.put(None)
+        if self._emit_thread:
+            self._emit_thread.join(timeout=2.0)
+            self._emit_thread = None
+
+        # Retire the translation worker so start/stop cycles don't leak it
+        self._translate_pool.shutdown(wait=False)
+
         # Release Whisper model to free CUDA memory
         if hasattr(self, '_transcriber') and self._transcriber:
             if hasattr(self._transcriber, '_model') and self._transcriber._model is not None:
@@ -4,10 +4,18 @@ Settings persistence for Real-time Subtitles.
 Saves and loads user settings to a JSON file.
 """
 
+import atexit
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class SettingsManager:
     """Manages saving and loading user settings."""
@@ -29,19 +37,31 @@ class SettingsManager:
         "console_mode": "verbose",
     }
     
+    # Coalescing window for save(): slider drags call save per tick, and
+    # each disk write only needs to happen once per burst
+    SAVE_DEBOUNCE_SECONDS = 0.5
+
     def __init__(self):
         """Initialize settings manager."""
         self._config_dir = Path.home() / ".config" / "realtime-subtitles"
         self._config_file = self._config_dir / "settings.json"
         self._settings = self.DEFAULT_SETTINGS.copy()
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        self._dirty = False
         self._load()
+        # Guarantee pending writes land even if the app exits mid-debounce
+        # (a no-op when nothing is dirty, so an externally deleted settings
+        # file is not resurrected at exit)
+        atexit.register(self.flush)
     
     def _load(self) -> None:
         """Load settings from file."""
         if self._config_file.exists():
             try:
-                with open(self._config_file, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
+                with open(self._config_file, "rb") as f:
+                    raw = f.read()
+                saved = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 # Merge with defaults (in case new settings were added)
                 self._settings = {**self.DEFAULT_SETTINGS, **saved}
                 from .logger import info
@@ -54,12 +74,40 @@ class SettingsManager:
             from .logger import info
             info("Settings: Using defaults (no saved settings)")
     
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)arm the coalescing save timer."""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
     def save(self) -> None:
-        """Save settings to file."""
+        """Save settings to file immediately."""
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk; a no-op when nothing changed."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
         try:
             self._config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self._config_file, "w", encoding="utf-8") as f:
-                json.dump(self._settings, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._settings, ensure_ascii=False, indent=2).encode("utf-8")
+            # Write-then-rename so a crash mid-save never truncates the file
+            tmp_path = self._config_file.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._config_file)
             from .logger import debug
             debug(f"Settings: Saved to {self._config_file}")
         except Exception as e:
@@ -71,12 +119,14 @@ class SettingsManager:
         return self._settings.get(key, default)
     
     def set(self, key: str, value) -> None:
-        """Set a setting value."""
+        """Set a setting value (persisted shortly after the last change)."""
         self._settings[key] = value
+        self._schedule_save()
     
     def update(self, settings: dict) -> None:
-        """Update multiple settings at once."""
+        """Update multiple settings at once (persisted shortly after)."""
         self._settings.update(settings)
+        self._schedule_save()
     
     def get_all(self) -> dict:
         """Get all settings."""
@@ -2,35 +2,47 @@
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 APP_TIMEZONE_SYSTEM = "system"
 _app_timezone_name = APP_TIMEZONE_SYSTEM
+# ZoneInfo instance for the selected timezone (None in system mode),
+# updated only in set_app_timezone_name so per-call paths just read it
+_app_zoneinfo: ZoneInfo | None = None
+
+# Compact IANA timezone list for UI selection
+_COMMON_TIMEZONES = (
+    "UTC",
+    "America/Los_Angeles",
+    "America/Denver",
+    "America/Chicago",
+    "America/New_York",
+    "America/Phoenix",
+    "America/Anchorage",
+    "Pacific/Honolulu",
+    "Europe/London",
+    "Europe/Paris",
+    "Europe/Berlin",
+    "Asia/Shanghai",
+    "Asia/Tokyo",
+    "Asia/Seoul",
+    "Asia/Singapore",
+    "Asia/Hong_Kong",
+    "Asia/Taipei",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> ZoneInfo:
+    """Memoized ZoneInfo constructor — avoids re-reading tzdata per call."""
+    return ZoneInfo(name)
 
 
 def available_timezone_names() -> list[str]:
     """Return a compact IANA timezone list for UI selection."""
-    common = [
-        "UTC",
-        "America/Los_Angeles",
-        "America/Denver",
-        "America/Chicago",
-        "America/New_York",
-        "America/Phoenix",
-        "America/Anchorage",
-        "Pacific/Honolulu",
-        "Europe/London",
-        "Europe/Paris",
-        "Europe/Berlin",
-        "Asia/Shanghai",
-        "Asia/Tokyo",
-        "Asia/Seoul",
-        "Asia/Singapore",
-        "Asia/Hong_Kong",
-        "Asia/Taipei",
-    ]
-    return common
+    return list(_COMMON_TIMEZONES)
 
 
 def validate_timezone_name(name: str) -> bool:
@@ -38,7 +50,7 @@ def validate_timezone_name(name: str) -> bool:
     if not name or name == APP_TIMEZONE_SYSTEM:
         return True
     try:
-        ZoneInfo(name)
+        _zoneinfo(name)
         return True
     except Exception:
         return False
@@ -46,11 +58,12 @@ def validate_timezone_name(name: str) -> bool:
 
 def set_app_timezone_name(name: str | None) -> str:
     """Set app timezone by IANA name; invalid values fall back to system."""
-    global _app_timezone_name
+    global _app_timezone_name, _app_zoneinfo
     candidate = (name or APP_TIMEZONE_SYSTEM).strip()
     if not validate_timezone_name(candidate):
         candidate = APP_TIMEZONE_SYSTEM
     _app_timezone_name = candidate
+    _app_zoneinfo = None if candidate == APP_TIMEZONE_SYSTEM else _zoneinfo(candidate)
     return _app_timezone_name
 
 
@@ -61,13 +74,13 @@ def get_app_timezone_name() -> str:
 
 def now_in_app_timezone() -> datetime:
     """Get current datetime using selected app timezone."""
-    if _app_timezone_name == APP_TIMEZONE_SYSTEM:
+    if _app_zoneinfo is None:
         return datetime.now().astimezone()
-    return datetime.now(ZoneInfo(_app_timezone_name))
+    return datetime.now(_app_zoneinfo)
 
 
 def datetime_from_timestamp(timestamp: float) -> datetime:
     """Convert UNIX timestamp to selected app timezone datetime."""
-    if _app_timezone_name == APP_TIMEZONE_SYSTEM:
+    if _app_zoneinfo is None:
         return datetime.fromtimestamp(timestamp).astimezone()
-    return datetime.fromtimestamp(timestamp, ZoneInfo(_app_timezone_name))
+    return datetime.fromtimestamp(timestamp, _app_zoneinfo)
@@ -5,7 +5,9 @@ Uses Sherpa-ONNX for high-accuracy streaming transcription.
 Better than Vosk for Chinese and English.
 """
 
+import io
 import os
+import shutil
 import tarfile
 import urllib.request
 import time
@@ -15,6 +17,9 @@ import numpy as np
 
 from ..logger import info, debug, warning
 
+# Models directory in the project root, resolved once at import
+_MODELS_DIR = Path(__file__).resolve().parents[3] / "models"
+
 # Sherpa import with error handling
 try:
     import sherpa_onnx
@@ -56,7 +61,12 @@ class SherpaTranscriber:
     }
     
     SAMPLE_RATE = 16000
-    
+
+    # Half a second of silence used to flush the stream in
+    # get_final_result; shared and read-only, so it is never re-zeroed
+    _TAIL_PADDING = np.zeros(int(SAMPLE_RATE * 0.5), dtype=np.float32)
+    _TAIL_PADDING.setflags(write=False)
+
     def __init__(
         self,
         language: str = "zh",
@@ -113,17 +123,18 @@ class SherpaTranscriber:
         self._stable_timeout = 0.8  # seconds of stable text before marking as final
         self._text_finalized = False
         self._max_segment_length = 80  # force new segment after this many characters
+
+        # Persistent float32 conversion scratch (grown on demand) so
+        # int16 or non-contiguous input costs one copy into reused memory
+        # instead of a fresh allocation per chunk
+        self._f32_scratch = np.empty(self.SAMPLE_RATE * 2, dtype=np.float32)
         
         info(f"SherpaTranscriber: Initialized with language={language}")
     
     def _get_model_dir(self) -> Path:
         """Get the model directory (project directory)."""
-        # Use project directory for portability
-        current = Path(__file__).resolve()
-        project_root = current.parent.parent.parent.parent
-        models_dir = project_root / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
-        return models_dir
+        _MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        return _MODELS_DIR
     
     def _get_or_download_model(self, language: str) -> Path:
         """Get model path, downloading if necessary."""
@@ -138,25 +149,29 @@ class SherpaTranscriber:
         # Need to download
         info(f"SherpaTranscriber: Downloading model: {model_info['name']}")
         info("SherpaTranscriber: This may take a while...")
-        
-        tar_path = model_dir / f"{model_info['name']}.tar.bz2"
-        
-        # Download with progress
-        def report_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(100, downloaded * 100 // total_size) if total_size > 0 else 0
-            pass  # Suppress progress output
-        
-        urllib.request.urlretrieve(model_info["url"], tar_path, report_progress)
-        
-        # Extract
+
+        # Stream the archive straight into the extractor: no .tar.bz2 is
+        # written and re-read from disk, and the 1MiB buffer keeps read
+        # syscalls low during the bz2 decode. Extraction lands in a staging
+        # directory renamed into place only on success, so an interrupted
+        # download can never leave a half-extracted model that passes the
+        # exists() check on the next launch.
         info("SherpaTranscriber: Extracting model...")
-        with tarfile.open(tar_path, "r:bz2") as tar:
-            tar.extractall(model_dir)
-        
-        # Remove tar file
-        tar_path.unlink()
-        
+        staging_dir = model_dir / f".{model_info['name']}.partial"
+        if staging_dir.exists():
+            shutil.rmtree(staging_dir)
+        staging_dir.mkdir(parents=True)
+        try:
+            with urllib.request.urlopen(model_info["url"]) as response:
+                buffered = io.BufferedReader(response, buffer_size=1 << 20)
+                with tarfile.open(fileobj=buffered, mode="r|bz2") as tar:
+                    tar.extractall(staging_dir)
+            (staging_dir / model_info["name"]).rename(model_path)
+        except BaseException:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
         info(f"SherpaTranscriber: Model ready: {model_path}")
         return model_path
     
@@ -170,7 +185,10 @@ class SherpaTranscriber:
         Returns:
             Full accumulated transcript text (continuous stream, no segmentation)
         """
-        # Feed audio to stream
+        # Feed audio to stream. Contiguous float32 passes straight through
+        # to the pybind layer; anything else converts once into the scratch.
+        if audio.dtype != np.float32 or not audio.flags['C_CONTIGUOUS']:
+            audio = self._to_scratch(audio)
         self._stream.accept_waveform(self.SAMPLE_RATE, audio)
         
         # Decode
@@ -185,6 +203,35 @@ class SherpaTranscriber:
         # No finalization, no segmentation - let TranslationStateManager handle that
         return text
     
+    def _to_scratch(self, audio: np.ndarray) -> np.ndarray:
+        """Convert samples into the persistent float32 scratch buffer."""
+        n = len(audio)
+        if len(self._f32_scratch) < n:
+            self._f32_scratch = np.empty(n, dtype=np.float32)
+        view = self._f32_scratch[:n]
+        np.copyto(view, audio, casting='unsafe')
+        return view
+
+    def process_audio_i16(self, audio_i16: np.ndarray) -> str:
+        """
+        Process int16 PCM without allocating a float32 copy per chunk.
+
+        One scaled multiply writes into the persistent scratch and the
+        resulting view feeds the regular path.
+
+        Args:
+            audio_i16: Audio samples (int16, 16kHz mono)
+
+        Returns:
+            Full accumulated transcript text
+        """
+        n = len(audio_i16)
+        if len(self._f32_scratch) < n:
+            self._f32_scratch = np.empty(n, dtype=np.float32)
+        view = self._f32_scratch[:n]
+        np.multiply(audio_i16, np.float32(1.0 / 32768.0), out=view)
+        return self.process_audio(view)
+
     def reset(self) -> None:
         """Reset the recognizer state."""
         self._recognizer.reset(self._stream)
@@ -193,8 +240,7 @@ class SherpaTranscriber:
     def get_final_result(self) -> str:
         """Get any remaining final result."""
         # Flush the stream
-        tail_paddings = np.zeros(int(self.SAMPLE_RATE * 0.5), dtype=np.float32)
-        self._stream.accept_waveform(self.SAMPLE_RATE, tail_paddings)
+        self._stream.accept_waveform(self.SAMPLE_RATE, self._TAIL_PADDING)
         
         while self._recognizer.is_ready(self._stream):
             self._recognizer.decode_stream(self._stream)
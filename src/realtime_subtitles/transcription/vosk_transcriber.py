@@ -7,6 +7,8 @@ no repetition issues unlike sliding window approaches.
 
 import json
 import os
+import re
+import shutil
 import zipfile
 import urllib.request
 from pathlib import Path
@@ -15,6 +17,14 @@ import numpy as np
 
 from ..logger import info, debug, warning
 
+# Vosk partials have the fixed shape {"partial": "..."}; pulling the value
+# with one regex skips a full JSON parse + dict allocation per audio chunk.
+# Result()/FinalResult() are rarer and richer, so they keep json.loads.
+_PARTIAL_RE = re.compile(r'"partial"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Models directory in the project root, resolved once at import
+_MODELS_DIR = Path(__file__).resolve().parents[3] / "models"
+
 # Vosk import with error handling
 try:
     from vosk import Model, KaldiRecognizer, SetLogLevel
@@ -24,6 +34,33 @@ except ImportError:
     Model = None
     KaldiRecognizer = None
 
+# Optional fused float32 -> int16 conversion (see process_audio)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _f32_to_i16(src, dst):
+        """Scale, saturate, and cast samples to int16 in one pass."""
+        for i in range(src.shape[0]):
+            v = src[i] * 32767.0
+            if v > 32767.0:
+                v = 32767.0
+            elif v < -32768.0:
+                v = -32768.0
+            dst[i] = np.int16(v)
+
+    # Compile at import so the JIT cost never lands on an audio chunk;
+    # failures just disable the fast path
+    try:
+        _f32_to_i16(np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.int16))
+    except Exception:
+        _f32_to_i16 = None
+else:
+    _f32_to_i16 = None
+
 
 class VoskTranscriber:
     """
@@ -110,17 +147,16 @@ class VoskTranscriber:
         # State
         self._partial_text = ""
         self._final_text = ""
+
+        # Persistent int16 conversion buffer, grown on demand
+        self._i16_buf = np.empty(self.SAMPLE_RATE, dtype=np.int16)
         
         info(f"VoskTranscriber: Initialized with language={language}")
     
     def _get_model_dir(self) -> Path:
         """Get the model directory (project directory)."""
-        # Use project directory for portability
-        current = Path(__file__).resolve()
-        project_root = current.parent.parent.parent.parent
-        models_dir = project_root / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
-        return models_dir
+        _MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        return _MODELS_DIR
     
     def _get_or_download_model(self, language: str) -> str:
         """Get model path, downloading if necessary."""
@@ -140,15 +176,12 @@ class VoskTranscriber:
         info("VoskTranscriber: This may take a while...")
         
         zip_path = model_dir / f"{model_info['name']}.zip"
-        
-        # Download with progress
-        def report_progress(block_num, block_size, total_size):
-            downloaded = block_num * block_size
-            percent = min(100, downloaded * 100 // total_size)
-            # Progress logged at debug level to avoid spam
-            pass  # Suppress progress output
-        
-        urllib.request.urlretrieve(model_info["url"], zip_path, report_progress)
+
+        # Single-pass copy with a 1MiB buffer; zip needs a seekable file,
+        # so unlike the tar models it can't extract straight from the stream
+        with urllib.request.urlopen(model_info["url"]) as response:
+            with open(zip_path, "wb") as f:
+                shutil.copyfileobj(response, f, length=1 << 20)
         
         # Extract
         info("VoskTranscriber: Extracting model...")
@@ -171,9 +204,18 @@ class VoskTranscriber:
         Returns:
             Full accumulated transcript text (continuous stream, no segmentation)
         """
-        # Convert to int16 for Vosk
-        audio_int16 = (audio * 32767).astype(np.int16)
-        audio_bytes = audio_int16.tobytes()
+        # Convert to int16 for Vosk. The numba kernel fuses the scale,
+        # saturation, and cast into a single pass over a persistent buffer
+        # instead of allocating float32 and int16 temporaries per chunk.
+        if _f32_to_i16 is not None:
+            n = len(audio)
+            if len(self._i16_buf) < n:
+                self._i16_buf = np.empty(n, dtype=np.int16)
+            view = self._i16_buf[:n]
+            _f32_to_i16(np.ascontiguousarray(audio, dtype=np.float32), view)
+            audio_bytes = view.tobytes()
+        else:
+            audio_bytes = (audio * 32767).astype(np.int16).tobytes()
         
         # Process
         if self._recognizer.AcceptWaveform(audio_bytes):
@@ -183,11 +225,15 @@ class VoskTranscriber:
             if text:
                 self._final_text = text
         else:
-            # Partial result
-            result = json.loads(self._recognizer.PartialResult())
-            text = result.get("partial", "")
-            if text:
-                self._partial_text = text
+            # Partial result (regex fast path; see _PARTIAL_RE)
+            match = _PARTIAL_RE.search(self._recognizer.PartialResult())
+            if match:
+                text = match.group(1)
+                if '\\' in text:
+                    # Rare escaped content: let json decode the literal
+                    text = json.loads(f'"{text}"')
+                if text:
+                    self._partial_text = text
         
         # Return the best current text (final if available, else partial)
         # This matches Sherpa's continuous stream behavior
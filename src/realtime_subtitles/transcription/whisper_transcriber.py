@@ -4,6 +4,7 @@ Whisper-based speech recognition using faster-whisper.
 Provides real-time speech-to-text using optimized Whisper models.
 """
 
+import re
 import time
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
@@ -12,6 +13,38 @@ import numpy as np
 
 from ..logger import info, debug, warning
 
+# Project layout, resolved once at import (transcription -> package -> src -> root)
+_MODELS_DIR = Path(__file__).resolve().parents[3] / "models"
+
+# Map model sizes to local folder names
+_MODEL_FOLDER_MAP = {
+    "large-v3": "faster-whisper-large-v3",
+    "large-v3-turbo": "faster-whisper-large-v3-turbo-ct2",
+    "medium": "faster-whisper-medium",
+}
+
+# Positive results only: a model that appears later (downloaded via the
+# Model Manager mid-session) must still be discoverable on the next probe
+_local_model_paths: dict = {}
+
+
+def _local_model_path(model_size: str) -> Optional[Path]:
+    """Resolve the local model folder for a model size, caching hits."""
+    cached = _local_model_paths.get(model_size)
+    if cached is not None:
+        return cached
+
+    folder_name = _MODEL_FOLDER_MAP.get(model_size)
+    if not folder_name:
+        return None
+
+    model_path = _MODELS_DIR / folder_name
+    if model_path.exists() and any(model_path.glob("*.bin")):
+        _local_model_paths[model_size] = model_path
+        return model_path
+
+    return None
+
 try:
     from faster_whisper import WhisperModel
 except ImportError:
@@ -156,27 +189,7 @@ class WhisperTranscriber:
     
     def _get_local_model_path(self) -> Optional[Path]:
         """Get path to local model in project directory if exists."""
-        # Map model sizes to local folder names
-        model_folder_map = {
-            "large-v3": "faster-whisper-large-v3",
-            "large-v3-turbo": "faster-whisper-large-v3-turbo-ct2",
-            "medium": "faster-whisper-medium",
-        }
-        
-        folder_name = model_folder_map.get(self.model_size)
-        if not folder_name:
-            return None
-        
-        # Find project root
-        current = Path(__file__).resolve()
-        project_root = current.parent.parent.parent.parent
-        model_path = project_root / "models" / folder_name
-        
-        # Check if model exists
-        if model_path.exists() and any(model_path.glob("*.bin")):
-            return model_path
-        
-        return None
+        return _local_model_path(self.model_size)
     
     def transcribe(
         self,
@@ -240,18 +253,18 @@ class WhisperTranscriber:
         """Filter out known Whisper hallucinations."""
         if not text:
             return text
-        
-        # Check if entire text is a hallucination
+
+        # One compiled alternation scan per pass instead of ~25 Python
+        # startswith/endswith probes; looping handles stacked patterns
         text_stripped = text.strip()
-        for pattern in self.HALLUCINATION_PATTERNS:
-            if text_stripped == pattern or text_stripped.lower() == pattern.lower():
+        while True:
+            if _HALLUC_FULL_RE.match(text_stripped):
                 debug(f"Whisper: Filtered hallucination: {text_stripped}")
                 return ""
-            # Also check if text starts/ends with hallucination
-            if text_stripped.startswith(pattern) or text_stripped.endswith(pattern):
-                text_stripped = text_stripped.replace(pattern, "").strip()
-        
-        return text_stripped
+            trimmed = _HALLUC_EDGE_RE.sub("", text_stripped).strip()
+            if trimmed == text_stripped:
+                return text_stripped
+            text_stripped = trimmed
     
     def transcribe_stream(
         self,
@@ -299,6 +312,13 @@ class WhisperTranscriber:
         return text, is_final
 
 
+# Hallucination matchers, compiled once over the class pattern list. The
+# full match is case-insensitive (mirroring the old lowercased equality
+# check); edge trimming stays case-sensitive like the old startswith path.
+_HALLUC_ALTS = "|".join(map(re.escape, WhisperTranscriber.HALLUCINATION_PATTERNS))
+_HALLUC_FULL_RE = re.compile(rf"^(?:{_HALLUC_ALTS})$", re.IGNORECASE)
+_HALLUC_EDGE_RE = re.compile(rf"^(?:{_HALLUC_ALTS})|(?:{_HALLUC_ALTS})$")
+
 # Quick test
 if __name__ == "__main__":
     import wave
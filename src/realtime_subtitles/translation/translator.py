@@ -88,6 +88,8 @@ class NLLBTranslator:
         model_size: str = "600m",
         target_language: str = "zho_Hant",
         device: str = "auto",
+        compute_type: str = "int8",
+        intra_threads: int = 4,
     ):
         """
         Initialize the NLLB translator.
@@ -96,6 +98,10 @@ class NLLBTranslator:
             model_size: Model size ("600m", "1.3b", or "3.3b")
             target_language: Target language code (NLLB format, e.g., "zho_Hant")
             device: Device to use ("auto", "cuda", "cpu")
+            compute_type: CTranslate2 compute type ("int8" uses VNNI dot
+                         products on modern CPUs at ~4x less RAM;
+                         "auto" picks the model's stored precision)
+            intra_threads: Threads per translation (OpenMP workers)
         """
         if not CTRANSLATE2_AVAILABLE:
             raise ImportError(
@@ -124,9 +130,9 @@ class NLLBTranslator:
         self._translator = ctranslate2.Translator(
             str(model_path),
             device=device,
-            compute_type="auto",
+            compute_type=compute_type,
             inter_threads=1,
-            intra_threads=4,
+            intra_threads=intra_threads,
         )
         
         # Load tokenizer from original model (use project models dir for cache)
@@ -232,6 +238,64 @@ class NLLBTranslator:
         
         return translated
     
+    def translate_batch(
+        self,
+        texts: list,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+    ) -> list:
+        """
+        Translate several texts in a single CTranslate2 batch call.
+
+        The encoder/decoder forward pass runs all sequences through the
+        same padded matmuls, so K short texts cost far less than K
+        separate translate() calls.
+
+        Args:
+            texts: Texts to translate
+            source_language: Source language code (optional, e.g., "ja")
+            target_language: Target language code (overrides default)
+
+        Returns:
+            Translated texts, in input order ("" for empty inputs)
+        """
+        texts = list(texts)
+        results = [""] * len(texts)
+        indices = [i for i, t in enumerate(texts) if t and t.strip()]
+        if not indices:
+            return results
+
+        target = target_language or self.target_language
+
+        if source_language and source_language in self.SOURCE_LANG_MAP:
+            src_lang = self.SOURCE_LANG_MAP[source_language]
+        else:
+            src_lang = "jpn_Jpan"  # Default to Japanese
+
+        with self._lock:
+            self._tokenizer.src_lang = src_lang
+
+            sources = [
+                self._tokenizer.convert_ids_to_tokens(self._tokenizer.encode(texts[i]))
+                for i in indices
+            ]
+
+            batch_results = self._translator.translate_batch(
+                sources,
+                target_prefix=[[target]] * len(sources),
+                beam_size=4,
+                max_decoding_length=256,
+            )
+
+            for i, result in zip(indices, batch_results):
+                output_tokens = result.hypotheses[0][1:]  # Skip lang token
+                results[i] = self._tokenizer.decode(
+                    self._tokenizer.convert_tokens_to_ids(output_tokens),
+                    skip_special_tokens=True,
+                ).strip()
+
+        return results
+
     def set_target_language(self, language: str) -> None:
         """Set the target language (NLLB format)."""
         self.target_language = language
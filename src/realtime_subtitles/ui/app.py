@@ -17,7 +17,7 @@ from ..pipeline import RealtimePipeline, SubtitleEvent
 from ..vosk_pipeline import StreamingPipeline
 from ..livecaptions.pipeline import LiveCaptionsPipeline
 from ..model_manager import ModelManager, ModelType, ModelStatus
-from ..i18n import t
+from ..i18n import t, hot
 from ..settings_manager import get_settings_manager
 from ..logger import set_console_mode, start_simple_log_session
 from ..timezone_utils import set_app_timezone_name
@@ -281,16 +281,16 @@ class App:
             # LiveCaptions mode: only show translation overlay
             if self._translation_overlay:
                 self._translation_overlay.show()
-                self._translation_overlay.update_subtitle(t("overlay_translation_waiting"), "")
+                self._translation_overlay.update_subtitle(hot.overlay_translation_waiting, "")
         else:
             # Other modes: show original subtitle overlay
             if self._overlay:
                 self._overlay.show()
-                self._overlay.update_subtitle(t("overlay_waiting"), "")
+                self._overlay.update_subtitle(hot.overlay_waiting, "")
             
             if self._translation_overlay:
                 self._translation_overlay.show()
-                self._translation_overlay.update_subtitle(t("overlay_translation_waiting"), "")
+                self._translation_overlay.update_subtitle(hot.overlay_translation_waiting, "")
         
         # Update tray
         if self._tray:
@@ -30,16 +30,6 @@ except ImportError:
     VOSK_AVAILABLE = False
     VoskTranscriber = None
 
-# Translation support (optional)
-try:
-    from .translation.translator import create_translator, CTRANSLATE2_AVAILABLE, GOOGLETRANS_AVAILABLE
-    TRANSLATION_AVAILABLE = CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE
-    debug(f"Translation module loaded, CTRANSLATE2={CTRANSLATE2_AVAILABLE}, GOOGLE={GOOGLETRANS_AVAILABLE}")
-except ImportError as e:
-    warning(f"Translation import failed: {e}")
-    TRANSLATION_AVAILABLE = False
-    create_translator = None
-
 # TranslationStateManager for incremental translation (matches LiveCaptions logic)
 from .livecaptions.manager import TranslationStateManager
 
@@ -104,11 +94,19 @@ class StreamingPipeline:
             self._transcriber = VoskTranscriber(language=language)
             self._engine_name = "Vosk"
         
-        # Translation (optional) - now using TranslationStateManager
+        # Translation (optional) - now using TranslationStateManager.
+        # The translation module is only imported when actually enabled.
         self._translator = None
         self._state_manager = None
-        if enable_translation and TRANSLATION_AVAILABLE:
+        if enable_translation:
             try:
+                from .translation.translator import (
+                    create_translator,
+                    CTRANSLATE2_AVAILABLE,
+                    GOOGLETRANS_AVAILABLE,
+                )
+                if not (CTRANSLATE2_AVAILABLE or GOOGLETRANS_AVAILABLE):
+                    raise ImportError("no translation backend available")
                 self._translator = create_translator(
                     engine=translation_engine,
                     target_language=target_language,
@@ -292,6 +290,10 @@ class StreamingPipeline:
                 self._audio_queue.get_nowait()
             except queue.Empty:
                 break
+
+        # Retire the state manager's background translation worker
+        if self._state_manager:
+            self._state_manager.shutdown()
         
         info("StreamingPipeline stopped")
     